@@ -1,15 +1,26 @@
-import streamlit as st
-import pandas as pd
-from datetime import datetime
 import os
 import sys
+from datetime import datetime
+
+# Make the src package importable regardless of the working directory
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src import profiling, startup
 
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+with startup.timed_import('streamlit'):
+    import streamlit as st
+with startup.timed_import('pandas'):
+    import pandas as pd
 
-from data_loader import DataLoader
-from analyzer import DataAnalyzer
-from charts import DashboardCharts
+import config
+with startup.timed_import('src.data_loader'):
+    from src.data_loader import DataLoader
+with startup.timed_import('src.analyzer'):
+    from src.analyzer import DataAnalyzer
+    from src.precompute import SnapshotReader
+with startup.timed_import('src.charts'):
+    from src.charts import DashboardCharts, FigureCache
+from src.exports import EXPORT_FORMATS, ExportCache, available_formats, frame_chunks
 
 # Page configuration
 st.set_page_config(
@@ -41,47 +52,243 @@ st.markdown("""
     </style>
     """, unsafe_allow_html=True)
 
+# Streamlit calls that serialize data for the browser, timed as render spans
+show_dataframe = profiling.timed('render', 'st.dataframe')(st.dataframe)
+show_chart = profiling.timed('render', 'st.plotly_chart')(st.plotly_chart)
+
+# Engagement performance columns each chart reads
+PROGRESS_CHART_COLUMNS = ['engagement_name', 'progress', 'status']
+BUDGET_CHART_COLUMNS = ['engagement_name', 'progress', 'status', 'budget_utilization_pct', 'budget_allocated']
+
+# Source tables each page reads; only these are loaded when it is opened
+PAGE_TABLES = {
+    "Executive Dashboard": ['clients', 'engagements', 'deliverables'],
+    "Portfolio Overview": ['clients', 'engagements', 'deliverables'],
+    "Client Details": ['clients', 'engagements', 'deliverables'],
+    "Engagement Analysis": ['engagements', 'deliverables'],
+    "Monthly Briefing": ['summaries'],
+    "At-Risk Items": ['engagements', 'deliverables'],
+    "Reports": [],  # Each report declares its own tables below
+}
+REPORT_TABLES = {
+    "Health Score Report": ['clients', 'engagements'],
+    "Financial Summary": ['clients', 'engagements', 'deliverables', 'summaries'],
+    "Deliverable Status": ['deliverables'],
+    "Client Satisfaction": ['clients', 'summaries'],
+}
+
+# Number of clients offered per page of the Client Details picker
+CLIENT_PICKER_PAGE_SIZE = 50
+
 # Initialize data loader
 @st.cache_resource
 def get_data_loader():
-    return DataLoader(data_dir="data")
+    return DataLoader(
+        data_dir=config.DATA_DIR,
+        compact=config.COMPACT_MEMORY_PROFILE,
+        category_max_ratio=config.CATEGORY_MAX_RATIO,
+        stream_min_bytes=config.STREAMING_INGEST_MIN_MB * 2**20,
+        chunk_rows=config.INGEST_CHUNK_ROWS,
+        shared_dir=config.SHARED_STORE_DIR
+    )
+
+@st.cache_resource
+def get_snapshot_reader():
+    return SnapshotReader(config.SNAPSHOT_DIR) if config.USE_PRECOMPUTED_SNAPSHOTS else None
 
-@st.cache_data(ttl=3600)
-def load_all_data():
+@st.cache_resource
+def get_analyzer():
+    # Tables are fetched from the loader the first time a page needs them
+    reader = get_snapshot_reader()
+    snapshot_source = reader.load if reader else None
+    if config.STORAGE_BACKEND != "memory":
+        from src.sql_backend import SQLAnalyzer, SQLStore
+        store = SQLStore(config.SQL_DATABASE_PATH, engine=config.STORAGE_BACKEND)
+        return SQLAnalyzer(store, get_data_loader(), snapshot_source=snapshot_source)
     loader = get_data_loader()
-    return {
-        'clients': loader.get_clients(),
-        'engagements': loader.get_engagements(),
-        'deliverables': loader.get_deliverables(),
-        'summaries': loader.get_monthly_summaries()
-    }
+    return DataAnalyzer(
+        table_source=loader.load_versioned,
+        snapshot_source=snapshot_source,
+        version_source=loader.table_version,
+        compact=config.COMPACT_MEMORY_PROFILE
+    )
+
+def stop_rerun():
+    """st.stop(), still recording the rerun's profile"""
+    try:
+        st.stop()
+    finally:
+        profiling.end_run(config.PROFILE_EXPORT_PATH)
+
+def query_param(name):
+    """First value of a URL query parameter, or None (st.query_params needs Streamlit 1.30)"""
+    if hasattr(st, "query_params"):
+        return st.query_params.get(name)
+    return (st.experimental_get_query_params().get(name) or [None])[0]
+
+@profiling.timed('loader')
+def load_page_data(tables):
+    """Load the tables a page needs and reload any held table whose CSV changed
+    
+    With a published snapshot, tables are instead loaded when first read.
+    """
+    if config.STORAGE_BACKEND != "memory":
+        # Tables stay in the database; frames are only fetched when a page reads them
+        try:
+            with st.spinner("Syncing database..."):
+                analyzer.sync()
+        except Exception as e:
+            st.error(f"Error loading data: {str(e)}")
+            stop_rerun()
+        return
+    
+    progress_bar = []
+    
+    def report_progress(name, bytes_read, total_bytes):
+        if not progress_bar:
+            progress_bar.append(st.progress(0.0))
+        progress_bar[0].progress(
+            min(bytes_read / total_bytes, 1.0),
+            text=f"Loading {name}: {bytes_read / 2**20:,.0f} of {total_bytes / 2**20:,.0f} MB"
+        )
+    
+    loader = get_data_loader()
+    reader = get_snapshot_reader()
+    try:
+        if reader is not None and reader.manifest() is not None:
+            # Precomputed results stand in for most of the page, so tables are
+            # only loaded when read; results of changed unloaded tables are dropped
+            held = analyzer.loaded_tables()
+            analyzer.discard_tables([name for name, version in list(analyzer.versions.items())
+                                     if name not in held and loader.table_version(name) != version])
+            tables = []
+        # Only tables not held yet, or whose file changed, are fetched
+        held = analyzer.loaded_tables()
+        names = [name for name in dict.fromkeys(list(tables) + held)
+                 if name not in held or loader.table_version(name) != analyzer.versions.get(name)]
+        # Large files are streamed in with a progress bar
+        snapshot = loader.load_tables(names, progress=report_progress)
+    except Exception as e:
+        st.error(f"Error loading data: {str(e)}")
+        st.info("Make sure all CSV files are in the 'data' directory")
+        stop_rerun()
+    if progress_bar:
+        progress_bar[0].empty()
+    
+    stale = {name: df for name, (version, df) in snapshot.items()
+             if analyzer.versions.get(name) != version}
+    if stale:
+        analyzer.update_tables(
+            versions={name: snapshot[name][0] for name in stale},
+            **stale
+        )
+
+@st.cache_resource
+def get_figure_cache():
+    return FigureCache(
+        max_entries=config.FIGURE_CACHE_MAX_ENTRIES,
+        max_bytes=config.FIGURE_CACHE_MAX_MB * 2**20
+    )
+
+def data_version(tables):
+    """Current version tokens of the source files behind the given tables
+
+    Read from the files rather than analyzer.versions, which has no entry
+    for a table that was discarded in snapshot mode and not reloaded.
+    """
+    loader = get_data_loader()
+    return tuple(loader.table_version(name) for name in tables)
+
+def cached_chart(chart, tables, get_data, **params):
+    """Build a chart, or reuse the figure built from the same table versions and params"""
+    return get_figure_cache().get(chart, data_version(tables), lambda **p: chart(get_data(), **p), **params)
 
-# Load data
-try:
-    data = load_all_data()
-    analyzer = DataAnalyzer(
-        data['clients'],
-        data['engagements'],
-        data['deliverables'],
-        data['summaries']
+@st.cache_resource
+def get_export_cache():
+    return ExportCache(config.EXPORT_CACHE_DIR)
+
+def export_download(label, name, version, get_chunks, key):
+    """Download button for an export written chunk by chunk and reused until its data version changes
+    
+    The file is built the first time the button is shown for a data version
+    and format, then read back from the export cache on later reruns, so
+    one click downloads it.
+    """
+    formats = available_formats()
+    default = formats.index(config.EXPORT_DEFAULT_FORMAT) if config.EXPORT_DEFAULT_FORMAT in formats else 0
+    col1, col2 = st.columns([1, 3])
+    fmt = col1.selectbox("Format", formats, index=default, format_func=lambda f: EXPORT_FORMATS[f].label,
+                         key=f"{key}_format")
+    with st.spinner("Preparing download..."):
+        path = get_export_cache().get(name, version, fmt, get_chunks)
+    export = EXPORT_FORMATS[fmt]
+    with open(path, 'rb') as f:
+        col2.download_button(
+            label=label,
+            data=f,
+            file_name=f"{name}_{datetime.now().strftime('%Y%m%d')}{export.extension}",
+            mime=export.mime,
+            key=key
+        )
+
+def frame_download(label, name, tables, df, key):
+    """Download a frame derived from the given tables"""
+    version = '|'.join(data_version(tables))
+    export_download(label, name, version, lambda: frame_chunks(df, config.EXPORT_CHUNK_ROWS), key)
+
+def table_download(label, name, key):
+    """Download a whole source table, streamed from the loader's cache rather than the frame in memory"""
+    loader = get_data_loader()
+    export_download(label, name, loader.table_version(name),
+                    lambda: loader.iter_batches(name, config.EXPORT_CHUNK_ROWS)[1], key)
+
+def paginated_table(key, index, filter_columns=(), sort_by=None, ascending=True,
+                    filters=None, ranges=None, columns=None):
+    """Show one page of an indexed table; filtering, sorting and slicing run server-side"""
+    controls = st.columns(len(filter_columns) + 2)
+    filters = dict(filters or {})
+    for control, column in zip(controls, filter_columns):
+        chosen = control.multiselect(f"Filter by {column}", index.values(column), key=f"{key}_filter_{column}")
+        if chosen:
+            filters[column] = chosen
+    sort_options = list(columns or index.df.columns)
+    sort_by = controls[-2].selectbox(
+        "Sort by", sort_options,
+        index=sort_options.index(sort_by) if sort_by in sort_options else 0,
+        key=f"{key}_sort"
     )
-except Exception as e:
-    st.error(f"Error loading data: {str(e)}")
-    st.info("Make sure all CSV files are in the 'data' directory")
-    st.stop()
+    ascending = controls[-1].checkbox("Ascending", value=ascending, key=f"{key}_ascending")
+    
+    positions = index.query(filters, ranges, sort_by=sort_by, ascending=ascending)
+    page_size = config.TABLE_PAGE_SIZE
+    page_count = max((len(positions) - 1) // page_size + 1, 1)
+    table_page = 1
+    if page_count > 1:
+        table_page = st.number_input(f"Page (of {page_count:,})", 1, page_count, 1, key=f"{key}_page")
+    
+    show_dataframe(index.page(positions, table_page, page_size, columns), use_container_width=True, hide_index=True)
+    start = (table_page - 1) * page_size
+    st.caption(f"Rows {min(start + 1, len(positions)):,}–{min(start + page_size, len(positions)):,} of {len(positions):,}")
+
+analyzer = get_analyzer()
 
 # Sidebar navigation
 st.sidebar.title("📊 Navigation")
+pages = list(PAGE_TABLES)
+# Hidden unless enabled in config or opened with ?perf=1
+if config.SHOW_PERFORMANCE_PAGE or query_param("perf") == "1":
+    pages.append("Performance")
 page = st.sidebar.radio(
     "Select View",
-    ["Executive Dashboard", "Portfolio Overview", "Client Details", "Engagement Analysis", 
-     "Monthly Briefing", "At-Risk Items", "Reports"]
+    pages
 )
+profiling.begin_run(page)
+load_page_data(PAGE_TABLES.get(page, []))
 
 st.sidebar.divider()
 st.sidebar.write(f"**Last Updated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
 if st.sidebar.button("🔄 Refresh Data"):
-    st.cache_data.clear()
+    # Changed files are picked up on every rerun; only their tables reload
     st.rerun()
 
 # ==================== EXECUTIVE DASHBOARD ====================
@@ -136,15 +343,15 @@ if page == "Executive Dashboard":
     col1, col2 = st.columns(2)
     
     with col1:
-        st.plotly_chart(
-            DashboardCharts.client_health_chart(analyzer.get_client_health()),
+        show_chart(
+            cached_chart(DashboardCharts.client_health_chart, ('clients', 'engagements'), analyzer.get_client_health),
             use_container_width=True,
             key="health_chart"
         )
     
     with col2:
-        st.plotly_chart(
-            DashboardCharts.engagement_progress_chart(analyzer.get_engagement_performance()),
+        show_chart(
+            cached_chart(DashboardCharts.engagement_progress_chart, ('engagements', 'deliverables'), lambda: analyzer.get_engagement_performance(PROGRESS_CHART_COLUMNS)),
             use_container_width=True,
             key="progress_chart"
         )
@@ -152,15 +359,15 @@ if page == "Executive Dashboard":
     col3, col4 = st.columns(2)
     
     with col3:
-        st.plotly_chart(
-            DashboardCharts.deliverable_status_chart(data['deliverables']),
+        show_chart(
+            cached_chart(DashboardCharts.deliverable_status_chart, ('deliverables',), lambda: analyzer.deliverables),
             use_container_width=True,
             key="deliverable_chart"
         )
     
     with col4:
-        st.plotly_chart(
-            DashboardCharts.client_status_breakdown(data['clients']),
+        show_chart(
+            cached_chart(DashboardCharts.client_status_breakdown, ('clients',), lambda: analyzer.clients),
             use_container_width=True,
             key="status_chart"
         )
@@ -172,22 +379,23 @@ elif page == "Portfolio Overview":
     col1, col2, col3 = st.columns(3)
     
     with col1:
-        st.plotly_chart(
-            DashboardCharts.industry_distribution_chart(data['clients']),
+        show_chart(
+            cached_chart(DashboardCharts.industry_distribution_chart, ('clients',), lambda: analyzer.clients),
             use_container_width=True,
             key="industry_chart"
         )
     
     with col2:
-        st.plotly_chart(
-            DashboardCharts.budget_utilization_chart(analyzer.get_engagement_performance()),
+        show_chart(
+            cached_chart(DashboardCharts.budget_utilization_chart, ('engagements', 'deliverables'), lambda: analyzer.get_engagement_performance(BUDGET_CHART_COLUMNS),
+                         webgl_threshold=config.LARGE_CHART_WEBGL_THRESHOLD, max_points=config.LARGE_CHART_MAX_POINTS),
             use_container_width=True,
             key="budget_chart"
         )
     
     with col3:
-        st.plotly_chart(
-            DashboardCharts.quality_metrics_chart(data['deliverables']),
+        show_chart(
+            cached_chart(DashboardCharts.quality_metrics_chart, ('deliverables',), lambda: analyzer.deliverables),
             use_container_width=True,
             key="quality_chart"
         )
@@ -196,12 +404,12 @@ elif page == "Portfolio Overview":
     
     # Performance table
     st.subheader("📋 Engagement Performance Details")
-    perf_data = analyzer.get_engagement_performance()
     display_cols = ['engagement_id', 'engagement_name', 'status', 'progress', 
                     'budget_utilization_pct', 'avg_quality_score', 'deliverable_completion_pct']
+    perf_data = analyzer.get_engagement_performance(display_cols)
     
-    st.dataframe(
-        perf_data[display_cols].sort_values('progress', ascending=False),
+    show_dataframe(
+        perf_data.sort_values('progress', ascending=False),
         use_container_width=True,
         hide_index=True
     )
@@ -210,12 +418,29 @@ elif page == "Portfolio Overview":
 elif page == "Client Details":
     st.title("👥 Client Details")
     
-    # Client selector
-    client_list = data['clients'].sort_values('client_name')
+    # Client selector: search, then pick from one page of matches
+    client_labels = get_data_loader().get_client_labels()
+    search = st.text_input("Search Clients", placeholder="Name or client ID")
+    if search:
+        client_labels = client_labels[client_labels.str.contains(search, case=False, regex=False)]
+    
+    if client_labels.empty:
+        st.info("No clients match your search")
+        stop_rerun()
+    
+    page_count = (len(client_labels) - 1) // CLIENT_PICKER_PAGE_SIZE + 1
+    picker_page = 1
+    if page_count > 1:
+        picker_page = st.number_input(
+            f"Page (of {page_count}, {len(client_labels)} clients)",
+            min_value=1, max_value=page_count, value=1
+        )
+    start = (picker_page - 1) * CLIENT_PICKER_PAGE_SIZE
+    page_labels = client_labels.iloc[start:start + CLIENT_PICKER_PAGE_SIZE].to_dict()
     selected_client = st.selectbox(
         "Select a Client",
-        client_list['client_id'],
-        format_func=lambda x: f"{data['clients'][data['clients']['client_id']==x]['client_name'].values[0]} ({x})"
+        list(page_labels),
+        format_func=page_labels.__getitem__
     )
     
     # Get client summary
@@ -248,9 +473,9 @@ elif page == "Client Details":
     
     # Engagements
     st.subheader("📌 Active Engagements")
-    engagements_df = pd.DataFrame(client_summary['engagements'])
+    engagements_df = client_summary['engagements']
     if not engagements_df.empty:
-        st.dataframe(
+        show_dataframe(
             engagements_df[['engagement_id', 'engagement_name', 'status', 'progress', 'budget_allocated', 'budget_spent']],
             use_container_width=True,
             hide_index=True
@@ -260,9 +485,9 @@ elif page == "Client Details":
     
     # Deliverables
     st.subheader("✅ Deliverables")
-    deliverables_df = pd.DataFrame(client_summary['deliverables'])
+    deliverables_df = client_summary['deliverables']
     if not deliverables_df.empty:
-        st.dataframe(
+        show_dataframe(
             deliverables_df[['deliverable_id', 'deliverable_name', 'status', 'due_date', 'quality_score']],
             use_container_width=True,
             hide_index=True
@@ -277,15 +502,16 @@ elif page == "Engagement Analysis":
     col1, col2 = st.columns(2)
     
     with col1:
-        st.plotly_chart(
-            DashboardCharts.engagement_progress_chart(analyzer.get_engagement_performance()),
+        show_chart(
+            cached_chart(DashboardCharts.engagement_progress_chart, ('engagements', 'deliverables'), lambda: analyzer.get_engagement_performance(PROGRESS_CHART_COLUMNS)),
             use_container_width=True,
             key="eng_progress"
         )
     
     with col2:
-        st.plotly_chart(
-            DashboardCharts.budget_utilization_chart(analyzer.get_engagement_performance()),
+        show_chart(
+            cached_chart(DashboardCharts.budget_utilization_chart, ('engagements', 'deliverables'), lambda: analyzer.get_engagement_performance(BUDGET_CHART_COLUMNS),
+                         webgl_threshold=config.LARGE_CHART_WEBGL_THRESHOLD, max_points=config.LARGE_CHART_MAX_POINTS),
             use_container_width=True,
             key="eng_budget"
         )
@@ -293,29 +519,25 @@ elif page == "Engagement Analysis":
     st.divider()
     
     # Filter options
+    engagement_index = analyzer.get_table_index('engagements')
     col1, col2 = st.columns(2)
     
     with col1:
         status_filter = st.multiselect(
             "Filter by Status",
-            data['engagements']['status'].unique(),
-            default=data['engagements']['status'].unique()
+            engagement_index.values('status'),
+            default=engagement_index.values('status')
         )
     
     with col2:
         min_progress = st.slider("Minimum Progress (%)", 0, 100, 0)
     
-    # Filtered table
-    filtered_eng = data['engagements'][
-        (data['engagements']['status'].isin(status_filter)) &
-        (data['engagements']['progress'] >= min_progress)
-    ]
-    
+    # Filtered table, one page at a time
     st.subheader("Engagement Details")
-    st.dataframe(
-        filtered_eng.sort_values('progress', ascending=False),
-        use_container_width=True,
-        hide_index=True
+    paginated_table(
+        "engagement_details", engagement_index,
+        sort_by='progress', ascending=False,
+        filters={'status': status_filter}, ranges={'progress': (min_progress, None)}
     )
 
 # ==================== MONTHLY BRIEFING ====================
@@ -325,15 +547,15 @@ elif page == "Monthly Briefing":
     col1, col2 = st.columns(2)
     
     with col1:
-        st.plotly_chart(
-            DashboardCharts.monthly_revenue_chart(analyzer.get_monthly_trends()),
+        show_chart(
+            cached_chart(DashboardCharts.monthly_revenue_chart, ('summaries',), analyzer.get_monthly_totals),
             use_container_width=True,
             key="revenue"
         )
     
     with col2:
-        st.plotly_chart(
-            DashboardCharts.hours_spent_chart(analyzer.get_monthly_trends()),
+        show_chart(
+            cached_chart(DashboardCharts.hours_spent_chart, ('summaries',), analyzer.get_monthly_totals),
             use_container_width=True,
             key="hours"
         )
@@ -341,8 +563,8 @@ elif page == "Monthly Briefing":
     col3, col4 = st.columns(2)
     
     with col3:
-        st.plotly_chart(
-            DashboardCharts.satisfaction_trend_chart(analyzer.get_monthly_trends()),
+        show_chart(
+            cached_chart(DashboardCharts.satisfaction_trend_chart, ('summaries',), analyzer.get_monthly_totals),
             use_container_width=True,
             key="satisfaction"
         )
@@ -364,11 +586,8 @@ elif page == "Monthly Briefing":
     
     # Summary table
     st.subheader("Monthly Metrics")
-    st.dataframe(
-        analyzer.get_monthly_trends().sort_values('date', ascending=False),
-        use_container_width=True,
-        hide_index=True
-    )
+    paginated_table("monthly_metrics", analyzer.get_table_index('monthly_trends'), ('client_id',),
+                    sort_by='date', ascending=False)
 
 # ==================== AT-RISK ITEMS ====================
 elif page == "At-Risk Items":
@@ -378,9 +597,8 @@ elif page == "At-Risk Items":
     
     # Over budget
     st.subheader("🔴 Over Budget Engagements")
-    if at_risk['over_budget_engagements']:
-        over_budget_df = pd.DataFrame(at_risk['over_budget_engagements'])
-        st.dataframe(over_budget_df, use_container_width=True, hide_index=True)
+    if not at_risk['over_budget_engagements'].empty:
+        show_dataframe(at_risk['over_budget_engagements'], use_container_width=True, hide_index=True)
     else:
         st.success("✅ No over-budget engagements!")
     
@@ -388,9 +606,8 @@ elif page == "At-Risk Items":
     
     # Paused engagements
     st.subheader("⏸️ Paused Engagements")
-    if at_risk['paused_engagements']:
-        paused_df = pd.DataFrame(at_risk['paused_engagements'])
-        st.dataframe(paused_df, use_container_width=True, hide_index=True)
+    if not at_risk['paused_engagements'].empty:
+        show_dataframe(at_risk['paused_engagements'], use_container_width=True, hide_index=True)
     else:
         st.success("✅ No paused engagements!")
     
@@ -398,9 +615,8 @@ elif page == "At-Risk Items":
     
     # Overdue deliverables
     st.subheader("📅 Overdue Deliverables")
-    if at_risk['at_risk_deliverables']:
-        overdue_df = pd.DataFrame(at_risk['at_risk_deliverables'])
-        st.dataframe(overdue_df, use_container_width=True, hide_index=True)
+    if not at_risk['at_risk_deliverables'].empty:
+        show_dataframe(at_risk['at_risk_deliverables'], use_container_width=True, hide_index=True)
     else:
         st.success("✅ No overdue deliverables!")
 
@@ -410,37 +626,32 @@ elif page == "Reports":
     
     report_type = st.selectbox(
         "Select Report Type",
-        ["Health Score Report", "Financial Summary", "Deliverable Status", "Client Satisfaction"]
+        list(REPORT_TABLES)
     )
+    load_page_data(REPORT_TABLES[report_type])
     
     if report_type == "Health Score Report":
         st.subheader("Client Health Scores")
         health_data = analyzer.get_client_health()
         
-        st.plotly_chart(
-            DashboardCharts.client_health_chart(health_data),
+        show_chart(
+            cached_chart(DashboardCharts.client_health_chart, ('clients', 'engagements'), lambda: health_data),
             use_container_width=True,
             key="health_report"
         )
         
-        st.dataframe(health_data, use_container_width=True, hide_index=True)
+        show_dataframe(health_data, use_container_width=True, hide_index=True)
         
-        if st.button("📥 Download Health Report"):
-            csv = health_data.to_csv(index=False)
-            st.download_button(
-                label="Download as CSV",
-                data=csv,
-                file_name=f"health_report_{datetime.now().strftime('%Y%m%d')}.csv",
-                mime="text/csv"
-            )
+        frame_download("📥 Download Health Report", "health_report", ('clients', 'engagements'),
+                       health_data, key="health_report_download")
     
     elif report_type == "Financial Summary":
         st.subheader("Financial Overview")
         
         col1, col2, col3 = st.columns(3)
-        total_contract = data['clients']['contract_value'].sum()
-        total_spent = data['engagements']['budget_spent'].sum()
-        total_allocated = data['engagements']['budget_allocated'].sum()
+        total_contract = analyzer.clients['contract_value'].sum()
+        total_spent = analyzer.engagements['budget_spent'].sum()
+        total_allocated = analyzer.engagements['budget_allocated'].sum()
         
         with col1:
             st.metric("Total Contract Value", f"${total_contract:,.0f}")
@@ -451,26 +662,30 @@ elif page == "Reports":
         
         st.divider()
         
-        st.plotly_chart(
-            DashboardCharts.monthly_revenue_chart(analyzer.get_monthly_trends()),
+        show_chart(
+            cached_chart(DashboardCharts.monthly_revenue_chart, ('summaries',), analyzer.get_monthly_totals),
             use_container_width=True,
             key="financial_revenue"
         )
         
         # Financial table
-        fin_data = analyzer.get_engagement_performance()[['engagement_id', 'engagement_name', 'budget_allocated', 'budget_spent', 'budget_utilization_pct']]
-        st.dataframe(fin_data, use_container_width=True, hide_index=True)
+        fin_data = analyzer.get_engagement_performance(['engagement_id', 'engagement_name', 'budget_allocated', 'budget_spent', 'budget_utilization_pct'])
+        show_dataframe(fin_data, use_container_width=True, hide_index=True)
+        frame_download("📥 Download Financial Data", "financial_summary", ('engagements', 'deliverables'),
+                       fin_data, key="financial_download")
     
     elif report_type == "Deliverable Status":
         st.subheader("Deliverable Completion Report")
         
-        st.plotly_chart(
-            DashboardCharts.deliverable_status_chart(data['deliverables']),
+        show_chart(
+            cached_chart(DashboardCharts.deliverable_status_chart, ('deliverables',), lambda: analyzer.deliverables),
             use_container_width=True,
             key="deliverable_report"
         )
         
-        st.dataframe(data['deliverables'], use_container_width=True, hide_index=True)
+        paginated_table("deliverable_status", analyzer.get_table_index('deliverables'), ('status',),
+                        sort_by='due_date')
+        table_download("📥 Download Deliverables", "deliverables", key="deliverables_download")
     
     elif report_type == "Client Satisfaction":
         st.subheader("Client Satisfaction Analysis")
@@ -478,20 +693,70 @@ elif page == "Reports":
         col1, col2 = st.columns(2)
         
         with col1:
-            st.plotly_chart(
-                DashboardCharts.satisfaction_trend_chart(analyzer.get_monthly_trends()),
+            show_chart(
+                cached_chart(DashboardCharts.satisfaction_trend_chart, ('summaries',), analyzer.get_monthly_totals),
                 use_container_width=True,
                 key="satisfaction_report"
             )
         
         with col2:
-            avg_satisfaction = analyzer.get_monthly_trends()['satisfaction_score'].mean()
+            rollup = analyzer.get_monthly_rollup()
+            avg_satisfaction = rollup['satisfaction_sum'].sum() / rollup['satisfaction_count'].sum()
             st.metric("Average Satisfaction", f"{avg_satisfaction:.2f}/5.0", delta="Out of 5")
             
             st.write("**Satisfaction by Month**")
-            monthly_sat = analyzer.get_monthly_trends().groupby('date')['satisfaction_score'].mean().reset_index()
-            st.dataframe(monthly_sat, use_container_width=True, hide_index=True)
+            monthly_sat = analyzer.get_monthly_totals()[['date', 'satisfaction_score']]
+            show_dataframe(monthly_sat, use_container_width=True, hide_index=True)
+        
+        table_download("📥 Download Monthly Summaries", "summaries", key="summaries_download")
+
+# ==================== PERFORMANCE ====================
+elif page == "Performance":
+    st.title("⏱️ Performance")
+    
+    runs = profiling.recent_runs()
+    if not runs:
+        st.info("No reruns recorded yet. Open another page, then come back.")
+        stop_rerun()
+    
+    labels = [f"{datetime.fromtimestamp(run['started']):%H:%M:%S} · {run['page']} · {run['total_ms']:,.0f} ms"
+              for run in runs]
+    run = runs[st.selectbox("Rerun", range(len(runs)), format_func=labels.__getitem__)]
+    spans = pd.DataFrame(run['spans'], columns=['category', 'name', 'cache', 'source', 'depth', 'offset_ms', 'ms', 'self_ms'])
+    
+    def hit_rate_label(rate):
+        return "—" if rate is None else f"{rate:.0%}"
+    
+    def run_hit_rate(category):
+        lookups = spans.loc[(spans['category'] == category) & spans['cache'].notna(), 'cache']
+        return profiling.hit_rate({'hits': int((lookups != 'miss').sum()), 'misses': int((lookups == 'miss').sum())})
+    
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Rerun Time", f"{run['total_ms']:,.0f} ms")
+    col2.metric("Analyzer Cache Hits", hit_rate_label(run_hit_rate('analyzer')),
+                help=f"Since start: {hit_rate_label(profiling.hit_rate(analyzer.cache_stats))}")
+    col3.metric("Figure Cache Hits", hit_rate_label(run_hit_rate('chart')),
+                help=f"Since start: {hit_rate_label(profiling.hit_rate(get_figure_cache().stats))}")
+    
+    st.subheader("Time by Category")
+    st.caption("Own time of each span, excluding nested spans; 'other' is everything untimed")
+    st.bar_chart(pd.DataFrame(profiling.breakdown(run)).set_index('category'))
+    
+    st.subheader("Spans")
+    show_dataframe(spans.sort_values('self_ms', ascending=False), use_container_width=True, hide_index=True)
+    
+    if config.PROFILE_EXPORT_PATH:
+        st.caption(f"Every rerun is also appended to `{config.PROFILE_EXPORT_PATH}`")
 
 st.sidebar.divider()
+startup.mark('first_render')
+if config.SHOW_STARTUP_REPORT:
+    with st.sidebar.expander("⏱️ Startup Timing"):
+        show_dataframe(pd.DataFrame(startup.startup_report()), use_container_width=True, hide_index=True)
+if config.COMPACT_MEMORY_PROFILE:
+    with st.sidebar.expander("💾 Memory Usage"):
+        show_dataframe(get_data_loader().memory_report(), use_container_width=True, hide_index=True)
 st.sidebar.markdown("---")
 st.sidebar.markdown("**Version:** 1.0.0  \n**Data Source:** Local CSV Files  \n**Last Sync:** Auto")
+
+profiling.end_run(config.PROFILE_EXPORT_PATH)
@@ -0,0 +1,89 @@
+"""
+Benchmark DataAnalyzer.get_client_health against the previous multi-pass
+implementation, from 1k to 1M engagements.
+
+Run from the project root:
+
+    python benchmarks/bench_client_health.py
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.analyzer import DataAnalyzer
+
+SIZES = [1_000, 10_000, 100_000, 1_000_000]
+ENGAGEMENTS_PER_CLIENT = 10
+REPEATS = 3
+
+
+def make_tables(n_engagements: int, seed: int = 0):
+    """Random clients/engagements frames with the production column layout"""
+    rng = np.random.default_rng(seed)
+    n_clients = max(1, n_engagements // ENGAGEMENTS_PER_CLIENT)
+    client_ids = np.array([f"C{i:07d}" for i in range(n_clients)], dtype=object)
+
+    clients = pd.DataFrame({
+        'client_id': client_ids,
+        'client_name': [f"Client {i}" for i in range(n_clients)],
+        'status': rng.choice(['Active', 'Completed', 'Paused'], n_clients),
+        'contract_value': rng.integers(50_000, 1_000_000, n_clients),
+    })
+    allocated = rng.integers(10_000, 500_000, n_engagements)
+    engagements = pd.DataFrame({
+        'engagement_id': [f"E{i:08d}" for i in range(n_engagements)],
+        'client_id': client_ids[rng.integers(0, n_clients, n_engagements)],
+        'status': rng.choice(['In Progress', 'Completed', 'On Hold'], n_engagements, p=[0.5, 0.4, 0.1]),
+        'progress': rng.integers(0, 101, n_engagements),
+        'budget_allocated': allocated,
+        'budget_spent': (allocated * rng.uniform(0, 1.2, n_engagements)).astype(int),
+    })
+    return clients, engagements
+
+
+def legacy_client_health(clients: pd.DataFrame, engagements: pd.DataFrame) -> pd.DataFrame:
+    """The four-groupby implementation get_client_health replaced"""
+    client_engagement_count = engagements.groupby('client_id').size()
+    client_avg_progress = engagements[engagements['status'] == 'In Progress'].groupby('client_id')['progress'].mean()
+    client_budget_utilization = (engagements.groupby('client_id')['budget_spent'].sum() /
+                                 engagements.groupby('client_id')['budget_allocated'].sum())
+
+    health_data = clients[['client_id', 'client_name', 'status']].copy()
+    health_data['engagement_count'] = health_data['client_id'].map(client_engagement_count)
+    health_data['avg_progress'] = health_data['client_id'].map(client_avg_progress).fillna(0)
+    health_data['budget_utilization'] = health_data['client_id'].map(client_budget_utilization).fillna(0)
+    return health_data
+
+
+def best_of(func, repeats: int = REPEATS) -> float:
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    print(f"{'engagements':>12} {'clients':>9} {'legacy (ms)':>12} {'fused (ms)':>11} {'speedup':>8}")
+    for size in SIZES:
+        clients, engagements = make_tables(size)
+        empty = engagements.iloc[:0]
+
+        def fused():
+            # A fresh analyzer per run so the memoized result is not reused
+            DataAnalyzer(clients, engagements, empty, empty).get_client_health()
+
+        legacy = best_of(lambda: legacy_client_health(clients, engagements))
+        current = best_of(fused)
+        print(f"{size:>12,} {len(clients):>9,} {legacy * 1000:>12.1f} {current * 1000:>11.1f} {legacy / current:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+"""
+Time data loading, every analyzer metric and every chart build on a
+synthetic dataset, and keep the results for comparison over time.
+
+Run from the project root:
+
+    python benchmarks/run_benchmarks.py [--clients N] [--months N] ... [--compare FILE]
+
+The dataset is generated once per scale under benchmarks/.data/. Each run
+is saved as benchmarks/results/<timestamp>.json and compared with the most
+recent earlier run at the same scale (or with --compare FILE).
+"""
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import time
+from dataclasses import asdict
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from benchmarks.synthetic import Scale, add_scale_arguments, scale_from_args, write_dataset
+from src.analyzer import DataAnalyzer
+from src.charts import DashboardCharts
+from src.data_loader import TABLE_SCHEMAS, DataLoader
+
+DATA_ROOT = ROOT / 'benchmarks' / '.data'
+RESULTS_DIR = ROOT / 'benchmarks' / 'results'
+
+# Analyzer metrics, timed on a fresh analyzer so memoized results are not reused
+ANALYZER_METRICS = {
+    'get_portfolio_summary': lambda a: a.get_portfolio_summary(),
+    'get_client_health': lambda a: a.get_client_health(),
+    'get_engagement_performance': lambda a: a.get_engagement_performance(),
+    'get_monthly_rollup': lambda a: a.get_monthly_rollup(),
+    'get_monthly_totals': lambda a: a.get_monthly_totals(),
+    'get_monthly_trends': lambda a: a.get_monthly_trends(),
+    'get_at_risk_items': lambda a: a.get_at_risk_items(),
+    'get_client_summary': lambda a: a.get_client_summary(a.clients['client_id'].iloc[0]),
+}
+
+# Chart builders with the analyzer result each one is drawn from
+CHARTS = {
+    'portfolio_metrics': lambda a: DashboardCharts.portfolio_metrics(a.get_portfolio_summary()),
+    'client_health_chart': lambda a: DashboardCharts.client_health_chart(a.get_client_health()),
+    'engagement_progress_chart': lambda a: DashboardCharts.engagement_progress_chart(a.get_engagement_performance()),
+    'budget_utilization_chart': lambda a: DashboardCharts.budget_utilization_chart(a.get_engagement_performance()),
+    'monthly_revenue_chart': lambda a: DashboardCharts.monthly_revenue_chart(a.get_monthly_totals()),
+    'hours_spent_chart': lambda a: DashboardCharts.hours_spent_chart(a.get_monthly_totals()),
+    'satisfaction_trend_chart': lambda a: DashboardCharts.satisfaction_trend_chart(a.get_monthly_totals()),
+    'deliverable_status_chart': lambda a: DashboardCharts.deliverable_status_chart(a.deliverables),
+    'quality_metrics_chart': lambda a: DashboardCharts.quality_metrics_chart(a.deliverables),
+    'industry_distribution_chart': lambda a: DashboardCharts.industry_distribution_chart(a.clients),
+    'client_status_breakdown': lambda a: DashboardCharts.client_status_breakdown(a.clients),
+}
+
+
+def best_of(func: Callable, repeats: int, setup: Optional[Callable] = None) -> float:
+    """Fastest of repeats runs of func(setup()), in seconds"""
+    timings = []
+    for _ in range(repeats):
+        arg = setup() if setup else None
+        start = time.perf_counter()
+        func(arg) if setup else func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def run(data_dir: Path, repeats: int) -> Dict[str, float]:
+    """Timings in milliseconds, keyed by '<group>.<name>'"""
+    timings = {}
+    cache_dir = data_dir / '.cache'
+
+    def cold_csv_loader():
+        return DataLoader(data_dir=str(data_dir), columnar=False)
+
+    def cold_parquet_loader():
+        return DataLoader(data_dir=str(data_dir), cache_dir=str(cache_dir))
+
+    for name in TABLE_SCHEMAS:
+        timings[f"load.csv.{name}"] = best_of(lambda loader: loader.load_table(name), repeats, cold_csv_loader)
+        DataLoader(data_dir=str(data_dir), cache_dir=str(cache_dir)).load_table(name)  # write the Parquet copy
+        timings[f"load.parquet.{name}"] = best_of(lambda loader: loader.load_table(name), repeats, cold_parquet_loader)
+
+    loader = DataLoader(data_dir=str(data_dir), cache_dir=str(cache_dir))
+    tables = {name: loader.load_table(name) for name in TABLE_SCHEMAS}
+
+    def fresh_analyzer():
+        return DataAnalyzer(tables['clients'], tables['engagements'], tables['deliverables'], tables['summaries'])
+
+    for name, metric in ANALYZER_METRICS.items():
+        timings[f"analyzer.{name}"] = best_of(metric, repeats, fresh_analyzer)
+
+    # Charts are timed on their own; the analyzer results they draw are cached
+    analyzer = fresh_analyzer()
+    for name, chart in CHARTS.items():
+        chart(analyzer)
+        timings[f"chart.{name}"] = best_of(lambda: chart(analyzer), repeats)
+
+    return {key: round(seconds * 1000, 3) for key, seconds in timings.items()}
+
+
+def count_rows(path: Path) -> int:
+    with open(path, 'rb') as f:
+        return sum(1 for _ in f) - 1
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT,
+                                       text=True, stderr=subprocess.DEVNULL).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def previous_result(scale: Scale, before: str) -> Optional[Dict]:
+    """Most recent saved run at the same scale, older than the run named before"""
+    for path in sorted(RESULTS_DIR.glob('*.json'), reverse=True):
+        if path.stem >= before:
+            continue
+        result = json.loads(path.read_text())
+        if result['scale'] == asdict(scale):
+            return result
+    return None
+
+
+def report(timings: Dict[str, float], baseline: Optional[Dict] = None):
+    base = baseline['timings'] if baseline else {}
+    header = f"{'benchmark':<42} {'ms':>10}"
+    if baseline:
+        header += f" {'baseline':>10} {'change':>8}   (vs {baseline['run']}, {baseline.get('commit') or '?'})"
+    print(header)
+    for key, ms in timings.items():
+        line = f"{key:<42} {ms:>10.1f}"
+        if key in base:
+            line += f" {base[key]:>10.1f} {(ms / base[key] - 1) * 100 if base[key] else 0:>+7.0f}%"
+        print(line)
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Benchmark the dashboard on synthetic data")
+    add_scale_arguments(parser)
+    parser.add_argument('--repeats', type=int, default=3)
+    parser.add_argument('--compare', metavar='FILE', help="saved result to compare with")
+    parser.add_argument('--no-save', action='store_true', help="do not store this run")
+    args = parser.parse_args(argv)
+    scale = scale_from_args(args)
+
+    data_dir = write_dataset(DATA_ROOT / '-'.join(str(value) for value in asdict(scale).values()), scale)
+    run_name = datetime.now().strftime('%Y%m%d-%H%M%S')
+    result = {
+        'run': run_name,
+        'commit': git_commit(),
+        'scale': asdict(scale),
+        'rows': {name: count_rows(data_dir / schema['filename']) for name, schema in TABLE_SCHEMAS.items()},
+        'environment': {
+            'python': platform.python_version(),
+            'pandas': pd.__version__,
+            'numpy': np.__version__,
+            'machine': platform.machine(),
+        },
+        'timings': run(data_dir, args.repeats),
+    }
+
+    baseline = json.loads(Path(args.compare).read_text()) if args.compare else previous_result(scale, run_name)
+    print(f"Scale: {scale}\nRows: {result['rows']}\n")
+    report(result['timings'], baseline)
+
+    if not args.no_save:
+        RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+        path = RESULTS_DIR / f"{run_name}.json"
+        path.write_text(json.dumps(result, indent=2))
+        print(f"\nSaved {path.relative_to(ROOT)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+"""
+Deterministic synthetic data matching the four dashboard CSV schemas.
+
+The same seed and scale always produce byte-identical files. Write a
+dataset from the project root with:
+
+    python benchmarks/synthetic.py OUT_DIR [--clients N] [--engagements-per-client N]
+                                           [--deliverables-per-engagement N] [--months N]
+"""
+
+import argparse
+import json
+import os
+import sys
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.data_loader import TABLE_SCHEMAS
+
+INDUSTRIES = ['Technology', 'Financial Services', 'Retail', 'Manufacturing', 'Healthcare', 'Energy']
+MANAGERS = ['John Smith', 'Sarah Johnson', 'Mike Chen', 'Jennifer Lee', 'Robert Wilson', 'Patricia Garcia']
+CLIENT_STATUSES = (['Active', 'Completed', 'Paused'], [0.7, 0.2, 0.1])
+ENGAGEMENT_STATUSES = (['In Progress', 'Completed', 'On Hold'], [0.5, 0.4, 0.1])
+DELIVERABLE_STATUSES = (['Completed', 'In Progress', 'Pending', 'On Hold'], [0.5, 0.25, 0.2, 0.05])
+RISKS = [None, 'Schedule delay risk', 'Budget overrun pending', 'Data quality issues', 'Vendor availability']
+MILESTONES = ['Planning completed', 'Architecture finalized', 'Pilot launched', 'Migration started', 'Go-live']
+
+# Column order of each CSV, as in the sample files
+CSV_COLUMNS = {
+    'clients': ['client_id', 'client_name', 'industry', 'status', 'start_date', 'contract_value', 'manager'],
+    'engagements': ['engagement_id', 'client_id', 'engagement_name', 'start_date', 'end_date', 'status',
+                    'progress', 'budget_allocated', 'budget_spent'],
+    'deliverables': ['deliverable_id', 'engagement_id', 'deliverable_name', 'due_date', 'completion_date',
+                     'status', 'quality_score'],
+    'summaries': ['summary_id', 'client_id', 'month', 'year', 'revenue_generated', 'hours_spent',
+                  'satisfaction_score', 'key_milestones', 'risks'],
+}
+
+
+@dataclass(frozen=True)
+class Scale:
+    """Size of a synthetic dataset"""
+    clients: int = 10_000
+    engagements_per_client: int = 10
+    deliverables_per_engagement: int = 10
+    months: int = 60
+    seed: int = 0
+
+
+def _ids(prefix: str, n: int) -> np.ndarray:
+    width = max(3, len(str(n)))
+    return np.array([f"{prefix}{i:0{width}d}" for i in range(1, n + 1)], dtype=object)
+
+
+def _choice(rng, options, n):
+    values, weights = options
+    return np.array(values, dtype=object)[rng.choice(len(values), n, p=weights)]
+
+
+def _dates(rng, start: str, days: int, n: int) -> pd.DatetimeIndex:
+    return pd.Timestamp(start) + pd.to_timedelta(rng.integers(0, days, n), unit='D')
+
+
+def make_frames(scale: Scale) -> Dict[str, pd.DataFrame]:
+    """The four tables at the given scale, keyed like TABLE_SCHEMAS"""
+    rng = np.random.default_rng(scale.seed)
+    n_clients = scale.clients
+    n_engagements = n_clients * scale.engagements_per_client
+    n_deliverables = n_engagements * scale.deliverables_per_engagement
+
+    client_ids = _ids('C', n_clients)
+    industry = np.array(INDUSTRIES, dtype=object)[rng.integers(0, len(INDUSTRIES), n_clients)]
+    clients = pd.DataFrame({
+        'client_id': client_ids,
+        'client_name': [f"Client {i} {name.split()[0]} Group" for i, name in enumerate(industry, 1)],
+        'industry': industry,
+        'status': _choice(rng, CLIENT_STATUSES, n_clients),
+        'start_date': _dates(rng, '2019-01-01', 5 * 365, n_clients),
+        'contract_value': rng.integers(50, 2_000, n_clients) * 1_000,
+        'manager': np.array(MANAGERS, dtype=object)[rng.integers(0, len(MANAGERS), n_clients)],
+    })
+
+    engagement_ids = _ids('E', n_engagements)
+    status = _choice(rng, ENGAGEMENT_STATUSES, n_engagements)
+    start = _dates(rng, '2020-01-01', 5 * 365, n_engagements)
+    allocated = rng.integers(20, 500, n_engagements) * 1_000
+    progress = np.where(status == 'Completed', 100, rng.integers(0, 100, n_engagements))
+    engagements = pd.DataFrame({
+        'engagement_id': engagement_ids,
+        'client_id': np.repeat(client_ids, scale.engagements_per_client),
+        'engagement_name': [f"Engagement {i}" for i in range(1, n_engagements + 1)],
+        'start_date': start,
+        'end_date': start + pd.to_timedelta(rng.integers(90, 720, n_engagements), unit='D'),
+        'status': status,
+        'progress': progress,
+        'budget_allocated': allocated,
+        'budget_spent': (allocated * rng.uniform(0.1, 1.2, n_engagements) * np.maximum(progress, 5) / 100).astype(np.int64),
+    })
+
+    d_status = _choice(rng, DELIVERABLE_STATUSES, n_deliverables)
+    completed = d_status == 'Completed'
+    due = _dates(rng, '2020-03-01', 6 * 365, n_deliverables)
+    completion = due + pd.to_timedelta(rng.integers(-10, 15, n_deliverables), unit='D')
+    deliverables = pd.DataFrame({
+        'deliverable_id': _ids('D', n_deliverables),
+        'engagement_id': np.repeat(engagement_ids, scale.deliverables_per_engagement),
+        'deliverable_name': [f"Deliverable {i}" for i in range(1, n_deliverables + 1)],
+        'due_date': due,
+        'completion_date': completion.where(completed),
+        'status': d_status,
+        'quality_score': np.where(completed, rng.integers(70, 101, n_deliverables), np.nan),
+    })
+
+    months = pd.period_range('2020-01', periods=scale.months, freq='M')
+    n_summaries = n_clients * scale.months
+    risks = np.array(RISKS, dtype=object)[rng.integers(0, len(RISKS), n_summaries)]
+    summaries = pd.DataFrame({
+        'summary_id': _ids('S', n_summaries),
+        'client_id': np.repeat(client_ids, scale.months),
+        'month': np.tile(months.month, n_clients),
+        'year': np.tile(months.year, n_clients),
+        'revenue_generated': rng.integers(10, 120, n_summaries) * 1_000,
+        'hours_spent': rng.integers(50, 600, n_summaries),
+        'satisfaction_score': rng.integers(30, 51, n_summaries) / 10,
+        'key_milestones': np.array(MILESTONES, dtype=object)[rng.integers(0, len(MILESTONES), n_summaries)],
+        'risks': risks,
+    })
+
+    frames = {'clients': clients, 'engagements': engagements, 'deliverables': deliverables, 'summaries': summaries}
+    return {name: frame[CSV_COLUMNS[name]] for name, frame in frames.items()}
+
+
+def write_dataset(out_dir, scale: Scale) -> Path:
+    """Write the four CSVs for scale into out_dir, unless they are already there
+
+    A scale.json marker records what was generated, so an existing dataset
+    of the same scale is reused.
+    """
+    out_dir = Path(out_dir)
+    marker = out_dir / 'scale.json'
+    if marker.exists() and json.loads(marker.read_text()) == asdict(scale):
+        return out_dir
+
+    out_dir.mkdir(parents=True, exist_ok=True)
+    for name, frame in make_frames(scale).items():
+        frame.to_csv(out_dir / TABLE_SCHEMAS[name]['filename'], index=False, date_format='%Y-%m-%d')
+    marker.write_text(json.dumps(asdict(scale)))
+    return out_dir
+
+
+def add_scale_arguments(parser: argparse.ArgumentParser):
+    """Command line options for each Scale field"""
+    for field, default in asdict(Scale()).items():
+        parser.add_argument(f"--{field.replace('_', '-')}", type=int, default=default)
+
+
+def scale_from_args(args) -> Scale:
+    return Scale(**{field: getattr(args, field) for field in asdict(Scale())})
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Write a deterministic synthetic dataset")
+    parser.add_argument('out_dir')
+    add_scale_arguments(parser)
+    args = parser.parse_args(argv)
+    scale = scale_from_args(args)
+    write_dataset(args.out_dir, scale)
+    print(f"Wrote {scale} to {args.out_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,13 +4,44 @@
 DATA_DIR = "data"
 CACHE_TTL = 3600  # Cache timeout in seconds (1 hour)
 
+# Memory profile: categoricals, downcast numerics and interned IDs
+COMPACT_MEMORY_PROFILE = False
+CATEGORY_MAX_RATIO = 0.5  # Max distinct/total ratio for a text column to become categorical
+
+# CSV files at least this large are ingested in chunks of INGEST_CHUNK_ROWS rows
+STREAMING_INGEST_MIN_MB = 64
+INGEST_CHUNK_ROWS = 200_000
+
+# "memory" keeps tables as pandas frames; "sqlite" or "duckdb" answers the
+# summary, health, performance and at-risk queries from a database file
+STORAGE_BACKEND = "memory"
+SQL_DATABASE_PATH = "data/.cache/portfolio.db"
+
+# Results published by the pre-computation worker (python -m src.precompute)
+# are memory-mapped from here when they match the loaded data
+USE_PRECOMPUTED_SNAPSHOTS = True
+SNAPSHOT_DIR = "data/.snapshots"
+# Source tables published there by the same worker are memory-mapped from
+# here, shared by every session and process; None always loads privately
+SHARED_STORE_DIR = "data/.shared"
+
+# Report downloads are written here in EXPORT_CHUNK_ROWS-row chunks and reused until the data changes
+EXPORT_CACHE_DIR = "data/.cache/exports"
+EXPORT_CHUNK_ROWS = 100_000
+EXPORT_DEFAULT_FORMAT = "csv.gz"  # csv, csv.gz, csv.zst (needs zstandard) or parquet
+
 # Display settings
 THEME = "light"
 DEFAULT_PAGE = "Executive Dashboard"
 SIDEBAR_STATE = "expanded"
+TABLE_PAGE_SIZE = 100  # Rows sent to the browser per page of the large tables
 
 # Chart settings
 CHART_HEIGHT = 400
+FIGURE_CACHE_MAX_ENTRIES = 128  # Built figures kept across reruns
+FIGURE_CACHE_MAX_MB = 64  # Cap on the serialized size of cached figures
+LARGE_CHART_WEBGL_THRESHOLD = 1000  # Scatter points above which WebGL is used
+LARGE_CHART_MAX_POINTS = 20000  # Scatter points above which points are binned
 CHART_COLORS = {
     'primary': '#1f77b4',
     'success': '#2ecc71',
@@ -41,5 +72,13 @@ HEALTH_SCORE_WEIGHTS = {
 DATE_FORMAT = "%Y-%m-%d"
 DISPLAY_DATE_FORMAT = "%B %d, %Y"
 
+# Show import times and time to first render in the sidebar
+SHOW_STARTUP_REPORT = False
+
+# Per-rerun timing of loader, analyzer, chart and render calls. The
+# Performance page is also reachable without this flag via ?perf=1
+SHOW_PERFORMANCE_PAGE = False
+PROFILE_EXPORT_PATH = None  # e.g. "reports/profile.jsonl" to append every rerun
+
 # Refresh interval (minutes)
 AUTO_REFRESH_INTERVAL = 60
@@ -66,6 +66,8 @@ def print_summary():
     print("\n  streamlit run app.py\n")
     print("The dashboard will open in your browser at:")
     print("  http://localhost:8501")
+    print("\nUnder heavy load, precompute the analytics in a separate process:")
+    print("\n  python -m src.precompute --watch 60")
     print("\nDocumentation: See README.md for detailed information")
     print("="*50 + "\n")
 
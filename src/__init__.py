@@ -1,10 +1,23 @@
 """
 Init file for src package
+
+The public classes are imported on first access so that importing one
+module (e.g. src.data_loader) does not pull in Plotly through src.charts.
 """
 
-from .data_loader import DataLoader
-from .analyzer import DataAnalyzer
-from .charts import DashboardCharts
+import importlib
+
+_EXPORTS = {
+    'DataLoader': '.data_loader',
+    'DataAnalyzer': '.analyzer',
+    'DashboardCharts': '.charts',
+}
 
 __all__ = ['DataLoader', 'DataAnalyzer', 'DashboardCharts']
 __version__ = '1.0.0'
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        return getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,17 +1,356 @@
+import copy
+import functools
+import json
+import threading
+from collections import OrderedDict
+
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
-from typing import Dict, List, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
+
+import config
+
+from .profiling import span
+from .table_index import NO_ROWS, AtRiskIndex, TableIndex
+
+# Source tables each memoized result is computed from, filled in by @memoized
+DEPENDENCIES = {}
+
+TABLES = ('clients', 'engagements', 'deliverables', 'summaries')
+
+# Grouping keys of the monthly summary rollup
+ROLLUP_KEYS = ['year', 'month', 'client_id', 'industry']
+CLIENT_MONTH_KEYS = ['year', 'month', 'client_id']
+
+# Number of engagements at which a client's activity score is maxed out
+ACTIVE_ENGAGEMENT_TARGET = 5
+
+
+def _hand_out(result):
+    """Shallow-copy a cached result so callers cannot alter the cached one"""
+    if isinstance(result, pd.DataFrame):
+        return result.copy(deep=False)
+    if isinstance(result, dict):
+        return {key: _hand_out(value) for key, value in result.items()}
+    return result
+
+
+def memoized(*tables, maxsize: Optional[int] = None, copy: bool = True):
+    """Cache a DataAnalyzer method's result until one of its source tables changes
+
+    Results are keyed by the call arguments; maxsize bounds how many argument
+    combinations are kept (least recently used first out). Internal lookup
+    structures pass copy=False so they are shared instead of copied per call.
+    On a miss, a precomputed snapshot of the result is used if one matches.
+    """
+    def decorator(method):
+        name = method.__name__
+        DEPENDENCIES[name] = tables
+
+        @functools.wraps(method)
+        def wrapper(self, *args):
+            with span('analyzer', name) as record:
+                with self._lock:
+                    entries = self._results.setdefault(name, OrderedDict())
+                    if args in entries:
+                        self.cache_stats['hits'] += 1
+                        record['cache'] = 'hit'
+                        entries.move_to_end(args)
+                        result = entries[args]
+                        return _hand_out(result) if copy else result
+                    self.cache_stats['misses'] += 1
+
+                result = self._from_snapshot(name) if not args else None
+                record['cache'] = 'miss' if result is None else 'snapshot'
+                if result is None:
+                    result = method(self, *args)
+                with self._lock:
+                    entries[args] = result
+                    if maxsize is not None and len(entries) > maxsize:
+                        entries.popitem(last=False)
+                return _hand_out(result) if copy else result
+
+        return wrapper
+    return decorator
+
+
+def budget_utilization_ratio(spent: np.ndarray, allocated: np.ndarray) -> np.ndarray:
+    """Spent over allocated budget; 0 when both are 0, inf for spend without a budget"""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ratio = np.asarray(spent, dtype=float) / np.asarray(allocated, dtype=float)
+    ratio[np.isnan(ratio)] = 0.0
+    return ratio
+
+
+def client_engagement_stats(client_ids: pd.Series, engagements: pd.DataFrame) -> Dict[str, np.ndarray]:
+    """Per-client engagement statistics from a single grouping pass
+    
+    Engagements are factorized on client_id once and every statistic is a
+    bincount over those codes. Engagements without a client_id are left out,
+    as groupby would. Arrays are aligned with client_ids; clients without
+    engagements get zeros.
+    """
+    codes, uniques = pd.factorize(engagements['client_id'])
+    n_groups = len(uniques)
+    has_client = codes >= 0
+    codes = codes[has_client]
+    in_progress = (engagements['status'] == 'In Progress').to_numpy()[has_client]
+    
+    def column(name):
+        return engagements[name].to_numpy(float)[has_client]
+    
+    engagement_count = np.bincount(codes, minlength=n_groups)
+    active_count = np.bincount(codes, weights=in_progress, minlength=n_groups)
+    progress_sum = np.bincount(codes, weights=column('progress') * in_progress, minlength=n_groups)
+    spent = np.bincount(codes, weights=column('budget_spent'), minlength=n_groups)
+    allocated = np.bincount(codes, weights=column('budget_allocated'), minlength=n_groups)
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        avg_progress = np.where(active_count > 0, progress_sum / active_count, 0.0)
+    budget_utilization = budget_utilization_ratio(spent, allocated)
+    
+    # Align the per-group arrays with the requested clients
+    positions = pd.Index(np.asarray(uniques, dtype=object)).get_indexer(np.asarray(client_ids, dtype=object))
+    found = positions >= 0
+    
+    def aligned(values, fill=0):
+        out = np.full(len(positions), fill, dtype=values.dtype)
+        out[found] = values[positions[found]]
+        return out
+    
+    return {
+        'engagement_count': aligned(engagement_count),
+        'avg_progress': aligned(avg_progress),
+        'budget_utilization': aligned(budget_utilization),
+    }
+
+
+def score_client_health(health_data: pd.DataFrame, weights: Dict) -> pd.DataFrame:
+    """Add the 0-100 health score to per-client stats and sort by it, best first
+    
+    health_data needs engagement_count, avg_progress and budget_utilization.
+    """
+    budget_efficiency = 100 - (health_data['budget_utilization'].to_numpy() * 100).clip(0, 100)
+    activity = health_data['engagement_count'].to_numpy().clip(0, ACTIVE_ENGAGEMENT_TARGET) / ACTIVE_ENGAGEMENT_TARGET * 100
+    health_data['health_score'] = (
+        health_data['avg_progress'].to_numpy() * weights['progress'] +
+        budget_efficiency * weights['budget_efficiency'] +
+        activity * weights['activity']
+    ).round(1)
+    return health_data.sort_values('health_score', ascending=False)
+
+
+def appended_rows(old: pd.DataFrame, new: pd.DataFrame,
+                  columns: Optional[List[str]] = None) -> Optional[pd.DataFrame]:
+    """Rows added to the end of old to make new, or None if old itself changed
+    
+    Only the given columns (all by default) are compared, one at a time on
+    their own dtypes, stopping at the first difference. Categoricals are
+    compared on old's categories, since a reload recomputes them.
+    """
+    if columns is None:
+        if list(new.columns) != list(old.columns):
+            return None
+        columns = old.columns
+    elif not set(columns) <= set(old.columns) & set(new.columns):
+        return None
+    if len(new) < len(old):
+        return None
+    for column in columns:
+        before = old[column].reset_index(drop=True)
+        after = new[column].iloc[:len(old)].reset_index(drop=True)
+        if isinstance(before.dtype, pd.CategoricalDtype) and isinstance(after.dtype, pd.CategoricalDtype):
+            recoded = after.cat.set_categories(before.cat.categories)
+            if recoded.isna().sum() != after.isna().sum():
+                return None  # a value outside old's categories
+            after = recoded
+        if not after.equals(before):
+            return None
+    return new.iloc[len(old):]
+
+
+def finish_rollup(rollup: pd.DataFrame) -> pd.DataFrame:
+    """Add the month date and sort a monthly rollup"""
+    rollup['date'] = pd.to_datetime(rollup[['year', 'month']].assign(day=1))
+    return rollup.sort_values(['date', 'client_id'], ignore_index=True)
+
+
+def merge_rollups(rollup: pd.DataFrame, extra: pd.DataFrame) -> pd.DataFrame:
+    """Combine two client-month rollups, summing the cells they share"""
+    combined = pd.concat([rollup, extra], ignore_index=True).drop(columns='date')
+    combined = combined.groupby(CLIENT_MONTH_KEYS, sort=False, observed=True).sum().reset_index()
+    return finish_rollup(combined)
+
+
+def snapshot_settings(health_weights: Dict, compact: bool) -> Dict:
+    """Analyzer settings a precomputed result depends on, as they read back from JSON"""
+    return json.loads(json.dumps({'health_weights': health_weights, 'compact': compact}, sort_keys=True))
+
+
+def _table_property(name: str):
+    """Attribute for a source table, fetched from table_source on first use"""
+    def getter(self):
+        df = self._tables.get(name)
+        if df is None:
+            if self.table_source is None:
+                raise ValueError(f"Table not loaded: {name}")
+            version, df = self.table_source(name)
+            with self._lock:
+                if self.versions.get(name) not in (None, version):
+                    # Results taken from a snapshot of another version of the table
+                    self.invalidate([name])
+                self._tables[name] = df
+                self.versions[name] = version
+        return df
+    
+    def setter(self, df):
+        self._tables[name] = df
+    
+    return property(getter, setter)
+
 
 class DataAnalyzer:
-    """Analyze portfolio and client data"""
+    """Analyze portfolio and client data
+
+    Derived results are memoized per method and kept until update_tables()
+    replaces one of the tables they depend on, so an analyzer held across
+    Streamlit reruns answers repeated calls without recomputing.
     
-    def __init__(self, clients_df, engagements_df, deliverables_df, summaries_df):
+    Tables may be left out and supplied by table_source, a callable returning
+    (version, frame) for a table name (e.g. DataLoader.load_versioned). They
+    are then only loaded once a metric actually reads them.
+    
+    snapshot_source, if given, returns (table_versions, settings, frame) for
+    a method name, or None (e.g. precompute.SnapshotReader.load). Results
+    built by the pre-computation worker are used instead of computing them
+    whenever they were built with the analyzer's health weights and memory
+    profile (compact) from the current table versions. Those are the held
+    versions, or for tables not loaded yet, the ones version_source reports
+    (e.g. DataLoader.table_version), so a snapshot can be used without
+    loading its source tables.
+    """
+    
+    clients = _table_property('clients')
+    engagements = _table_property('engagements')
+    deliverables = _table_property('deliverables')
+    summaries = _table_property('summaries')
+    
+    def __init__(self, clients_df=None, engagements_df=None, deliverables_df=None, summaries_df=None,
+                 health_weights: Optional[Dict] = None, table_source: Optional[Callable] = None,
+                 snapshot_source: Optional[Callable] = None, version_source: Optional[Callable] = None,
+                 compact: bool = False):
+        self._tables = {}
         self.clients = clients_df
         self.engagements = engagements_df
         self.deliverables = deliverables_df
         self.summaries = summaries_df
+        self.table_source = table_source
+        self.snapshot_source = snapshot_source
+        self.version_source = version_source
+        self.compact = compact
+        self.health_weights = health_weights or config.HEALTH_SCORE_WEIGHTS
+        self.versions = {}
+        self._results = {}
+        self._lock = threading.RLock()
+        self.cache_stats = {'hits': 0, 'misses': 0}
+    
+    def loaded_tables(self) -> List[str]:
+        """Names of the source tables currently held"""
+        return [name for name in TABLES if self._tables.get(name) is not None]
+    
+    def update_tables(self, versions: Optional[Dict[str, str]] = None, **tables):
+        """Swap in reloaded source tables and drop the results derived from them
+        
+        versions records the loader's version token for each table, so callers
+        can tell which tables the analyzer is behind on.
+        """
+        for name in tables:
+            if name not in TABLES:
+                raise ValueError(f"Unknown table: {name}")
+        with self._lock:
+            previous = {name: self._tables.get(name) for name in tables}
+            rollup = self._results.get('_client_month_rollup', {}).get(())
+            at_risk = self._results.get('_at_risk_index', {}).get(())
+            for name, df in tables.items():
+                setattr(self, name, df)
+            self.versions.update(versions or {})
+            self.invalidate(tables)
+            
+            # Appended summary rows extend the rollup instead of rebuilding it
+            if 'summaries' in tables and rollup is not None:
+                new_rows = appended_rows(previous['summaries'], self.summaries)
+                if new_rows is not None:
+                    rollup = merge_rollups(rollup, self._build_rollup(new_rows))
+                    self._results['_client_month_rollup'] = OrderedDict({(): rollup})
+            
+            # Likewise the at-risk index, for appended engagements/deliverables;
+            # edits to columns it does not read leave it valid
+            if at_risk is not None:
+                at_risk = copy.copy(at_risk)  # readers may still hold the current one
+                for name, extend in (('engagements', at_risk.extend_engagements),
+                                     ('deliverables', at_risk.extend_deliverables)):
+                    if name in tables:
+                        new_rows = appended_rows(previous[name], self._tables[name], AtRiskIndex.COLUMNS[name])
+                        if new_rows is None:
+                            break
+                        extend(new_rows)
+                else:
+                    self._results['_at_risk_index'] = OrderedDict({(): at_risk})
+    
+    def discard_tables(self, tables):
+        """Drop held tables, their versions and the results derived from them
+        
+        They are fetched from table_source again the next time they are read.
+        """
+        with self._lock:
+            for name in tables:
+                self._tables.pop(name, None)
+                self.versions.pop(name, None)
+            self.invalidate(tables)
+    
+    def _from_snapshot(self, name: str):
+        """Precomputed result of a memoized method, if built from the current table versions"""
+        if self.snapshot_source is None:
+            return None
+        snapshot = self.snapshot_source(name)
+        if snapshot is None:
+            return None
+        table_versions, settings, frame = snapshot
+        if settings != snapshot_settings(self.health_weights, self.compact):
+            return None
+        if name == '_at_risk_index':
+            # Row positions need the tables themselves; load them before checking versions
+            counts = len(self.engagements), len(self.deliverables)
+        
+        current = {}
+        for table in DEPENDENCIES[name]:
+            version = self.versions.get(table)
+            if version is None and self.version_source is not None:
+                try:
+                    version = self.version_source(table)
+                except OSError:
+                    return None
+            if version is None or table_versions.get(table) != version:
+                return None
+            current[table] = version
+        with self._lock:
+            # Until a table is loaded, its version is the one the snapshot was checked against
+            for table, version in current.items():
+                self.versions.setdefault(table, version)
+        
+        if name == '_at_risk_index':
+            return AtRiskIndex.from_frame(frame, *counts)
+        return frame
     
+    def invalidate(self, tables=None):
+        """Forget cached results depending on any of the given tables (all if None)"""
+        with self._lock:
+            for method in list(self._results):
+                if tables is None or set(DEPENDENCIES[method]) & set(tables):
+                    del self._results[method]
+    
+    @memoized('clients', 'engagements')
     def get_portfolio_summary(self) -> Dict:
         """Get overall portfolio metrics"""
         return {
@@ -24,43 +363,43 @@ class DataAnalyzer:
             'average_progress': self.engagements[self.engagements['status'] == 'In Progress']['progress'].mean(),
         }
     
+    @memoized('clients', 'engagements')
     def get_client_health(self) -> pd.DataFrame:
         """Get health metrics for each client"""
-        client_engagement_count = self.engagements.groupby('client_id').size()
-        client_avg_progress = self.engagements[self.engagements['status'] == 'In Progress'].groupby('client_id')['progress'].mean()
-        client_budget_utilization = (self.engagements.groupby('client_id')['budget_spent'].sum() / 
-                                      self.engagements.groupby('client_id')['budget_allocated'].sum())
+        stats = client_engagement_stats(self.clients['client_id'], self.engagements)
         
         health_data = self.clients[['client_id', 'client_name', 'status']].copy()
-        health_data['engagement_count'] = health_data['client_id'].map(client_engagement_count)
-        health_data['avg_progress'] = health_data['client_id'].map(client_avg_progress).fillna(0)
-        health_data['budget_utilization'] = health_data['client_id'].map(client_budget_utilization).fillna(0)
-        
-        # Calculate health score (0-100)
-        health_data['health_score'] = (
-            (health_data['avg_progress'] * 0.5) +  # 50% based on progress
-            (100 - (health_data['budget_utilization'] * 100).clip(0, 100) * 0.3) +  # 30% on budget efficiency
-            (health_data['engagement_count'].clip(0, 5) / 5 * 100 * 0.2)  # 20% on activity
-        ).round(1)
-        
-        return health_data.sort_values('health_score', ascending=False)
-    
-    def get_engagement_performance(self) -> pd.DataFrame:
-        """Get performance metrics for each engagement"""
-        perf_data = self.engagements.copy()
-        perf_data['budget_remaining'] = perf_data['budget_allocated'] - perf_data['budget_spent']
-        perf_data['budget_utilization_pct'] = (perf_data['budget_spent'] / perf_data['budget_allocated'] * 100).round(1)
-        
-        # Add deliverable info
-        deliverable_stats = self.deliverables.groupby('engagement_id').agg({
-            'deliverable_id': 'count',
-            'status': lambda x: (x == 'Completed').sum(),
-            'quality_score': 'mean'
-        }).rename(columns={
-            'deliverable_id': 'total_deliverables',
-            'status': 'completed_deliverables',
-            'quality_score': 'avg_quality_score'
-        })
+        health_data['engagement_count'] = stats['engagement_count']
+        health_data['avg_progress'] = stats['avg_progress']
+        health_data['budget_utilization'] = stats['budget_utilization']
+        
+        return score_client_health(health_data, self.health_weights)
+    
+    def get_engagement_performance(self, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """Get performance metrics for each engagement
+        
+        Pass columns to get just those columns of the (cached) result.
+        """
+        perf_data = self._engagement_performance()
+        return perf_data[list(columns)] if columns else perf_data
+    
+    @memoized('engagements', 'deliverables')
+    def _engagement_performance(self) -> pd.DataFrame:
+        budget_allocated = self.engagements['budget_allocated']
+        budget_spent = self.engagements['budget_spent']
+        perf_data = self.engagements.assign(
+            budget_remaining=budget_allocated - budget_spent,
+            budget_utilization_pct=(budget_spent / budget_allocated * 100).round(1)
+        )
+        
+        # Add deliverable info: one native groupby over a precomputed flag
+        deliverable_stats = self.deliverables[['engagement_id', 'deliverable_id', 'quality_score']].assign(
+            completed=(self.deliverables['status'] == 'Completed').to_numpy()
+        ).groupby('engagement_id', sort=False, observed=True).agg(
+            total_deliverables=('deliverable_id', 'count'),
+            completed_deliverables=('completed', 'sum'),
+            avg_quality_score=('quality_score', 'mean')
+        )
         
         perf_data = perf_data.merge(deliverable_stats, left_on='engagement_id', right_index=True, how='left')
         perf_data['deliverable_completion_pct'] = (
@@ -71,6 +410,53 @@ class DataAnalyzer:
         
         return perf_data
     
+    @memoized('clients', 'summaries')
+    def get_monthly_rollup(self) -> pd.DataFrame:
+        """Monthly summary totals keyed by (year, month, client_id, industry)
+        
+        Satisfaction is kept as a sum and a count so rollups can be merged
+        and averaged exactly.
+        """
+        rollup = self._client_month_rollup()
+        industry_by_client = pd.Series(
+            np.asarray(self.clients['industry'], dtype=object),
+            index=np.asarray(self.clients['client_id'], dtype=object)
+        )
+        rollup.insert(3, 'industry', rollup['client_id'].astype(object).map(industry_by_client))
+        return rollup
+    
+    @memoized('summaries')
+    def _client_month_rollup(self) -> pd.DataFrame:
+        """Monthly summary totals per client, folded forward by update_tables()
+        when summary rows are only appended"""
+        return self._build_rollup(self.summaries)
+    
+    def _build_rollup(self, summaries: pd.DataFrame) -> pd.DataFrame:
+        rows = summaries[CLIENT_MONTH_KEYS + ['revenue_generated', 'hours_spent', 'satisfaction_score']].assign(
+            satisfaction_count=summaries['satisfaction_score'].notna().astype(int)
+        )
+        rollup = rows.groupby(CLIENT_MONTH_KEYS, sort=False, observed=True).agg(
+            revenue_generated=('revenue_generated', 'sum'),
+            hours_spent=('hours_spent', 'sum'),
+            satisfaction_sum=('satisfaction_score', 'sum'),
+            satisfaction_count=('satisfaction_count', 'sum'),
+            summary_count=('satisfaction_count', 'size')
+        ).reset_index()
+        return finish_rollup(rollup)
+    
+    @memoized('summaries')
+    def get_monthly_totals(self) -> pd.DataFrame:
+        """Portfolio-wide revenue, hours and mean satisfaction per month, from the rollup"""
+        totals = self._client_month_rollup().groupby('date', sort=True).agg(
+            revenue_generated=('revenue_generated', 'sum'),
+            hours_spent=('hours_spent', 'sum'),
+            satisfaction_sum=('satisfaction_sum', 'sum'),
+            satisfaction_count=('satisfaction_count', 'sum')
+        ).reset_index()
+        totals['satisfaction_score'] = totals['satisfaction_sum'] / totals['satisfaction_count'].replace(0, np.nan)
+        return totals.drop(columns=['satisfaction_sum', 'satisfaction_count'])
+    
+    @memoized('summaries')
     def get_monthly_trends(self) -> pd.DataFrame:
         """Get monthly trends for revenue and hours"""
         trends = self.summaries.copy()
@@ -78,47 +464,146 @@ class DataAnalyzer:
         trends = trends.sort_values('date')
         return trends
     
-    def get_at_risk_items(self) -> Dict:
-        """Identify at-risk engagements and deliverables"""
-        at_risk = {
-            'over_budget_engagements': [],
-            'at_risk_deliverables': [],
-            'paused_engagements': []
+    def get_at_risk_items(self, as_of=None) -> Dict[str, pd.DataFrame]:
+        """Identify at-risk engagements and deliverables
+        
+        Deliverables count as overdue if still open and due before as_of
+        (default: now). Read from the at-risk index, so only the at-risk
+        rows are touched.
+        """
+        index = self._at_risk_index()
+        as_of = pd.Timestamp.now() if as_of is None else as_of
+        return {
+            'over_budget_engagements': self.engagements.iloc[index.over_budget][
+                ['engagement_id', 'engagement_name', 'budget_allocated', 'budget_spent']],
+            'at_risk_deliverables': self.deliverables.iloc[np.sort(index.overdue(as_of))][
+                ['deliverable_id', 'deliverable_name', 'due_date', 'status']],
+            'paused_engagements': self.engagements.iloc[index.on_hold][
+                ['engagement_id', 'engagement_name', 'progress']],
         }
+    
+    @memoized('engagements', 'deliverables', copy=False)
+    def _at_risk_index(self) -> AtRiskIndex:
+        """At-risk row positions, extended by update_tables() when rows are only appended"""
+        return AtRiskIndex(self.engagements, self.deliverables)
+    
+    def get_table_index(self, name: str) -> TableIndex:
+        """Filter and sort index behind a paginated table view
         
-        # Over budget engagements
-        over_budget = self.engagements[self.engagements['budget_spent'] > self.engagements['budget_allocated']]
-        at_risk['over_budget_engagements'] = over_budget[['engagement_id', 'engagement_name', 'budget_allocated', 'budget_spent']].to_dict('records')
+        name is 'engagements', 'deliverables' or 'monthly_trends'; the index
+        is rebuilt only when its source table changes.
+        """
+        builders = {
+            'engagements': self._engagements_index,
+            'deliverables': self._deliverables_index,
+            'monthly_trends': self._monthly_trends_index,
+        }
+        if name not in builders:
+            raise ValueError(f"No table index for: {name}")
+        return builders[name]()
+    
+    @memoized('engagements', copy=False)
+    def _engagements_index(self) -> TableIndex:
+        return TableIndex(self.engagements)
+    
+    @memoized('deliverables', copy=False)
+    def _deliverables_index(self) -> TableIndex:
+        return TableIndex(self.deliverables)
+    
+    @memoized('summaries', copy=False)
+    def _monthly_trends_index(self) -> TableIndex:
+        return TableIndex(self.get_monthly_trends())
+    
+    @memoized('clients', copy=False)
+    def _client_positions(self) -> Dict:
+        """Row position of each client, keyed by client_id"""
+        return dict(zip(self.clients['client_id'], range(len(self.clients))))
+    
+    @memoized('engagements', copy=False)
+    def _engagements_by_client(self) -> Dict:
+        """Engagement row positions grouped by client_id"""
+        return self.engagements.groupby('client_id', sort=False, observed=True).indices
+    
+    @memoized('deliverables', copy=False)
+    def _deliverables_by_engagement(self) -> Dict:
+        """Deliverable row positions grouped by engagement_id"""
+        return self.deliverables.groupby('engagement_id', sort=False, observed=True).indices
+    
+    @memoized('clients', 'engagements', copy=False)
+    def _health_by_client(self) -> Dict:
+        """Client health row positions, keyed by client_id"""
+        return self.get_client_health().groupby('client_id', sort=False, observed=True).indices
+    
+    @memoized('clients', 'summaries', copy=False)
+    def _rollup_by_client(self) -> Dict:
+        """Monthly rollup row positions grouped by client_id"""
+        return self.get_monthly_rollup().groupby('client_id', sort=False, observed=True).indices
+    
+    def client_rows(self, result: str, client_ids) -> np.ndarray:
+        """Row positions of the given clients in a client-keyed frame, in row order
         
-        # Paused engagements
-        paused = self.engagements[self.engagements['status'] == 'On Hold']
-        at_risk['paused_engagements'] = paused[['engagement_id', 'engagement_name', 'progress']].to_dict('records')
+        result is 'clients', 'engagements' (whose rows get_engagement_performance
+        keeps), 'client_health' or 'monthly_rollup'. Positions come from the
+        memoized client_id indexes, so the cost depends on the clients' own
+        rows rather than the frame size.
+        """
+        index = {
+            'clients': self._client_positions,
+            'engagements': self._engagements_by_client,
+            'client_health': self._health_by_client,
+            'monthly_rollup': self._rollup_by_client,
+        }[result]()
+        positions = [np.atleast_1d(index[client_id]) for client_id in set(client_ids) if client_id in index]
+        return np.sort(np.concatenate(positions)) if positions else NO_ROWS
+    
+    def get_client_deliverables(self, client_ids) -> pd.DataFrame:
+        """Deliverables of the given clients, with the client_id of each
         
-        # Overdue deliverables
-        today = pd.Timestamp.now()
-        overdue = self.deliverables[
-            (self.deliverables['due_date'] < today) & 
-            (self.deliverables['status'] != 'Completed')
-        ]
-        at_risk['at_risk_deliverables'] = overdue[['deliverable_id', 'deliverable_name', 'due_date', 'status']].to_dict('records')
+        Rows and columns are as from merging the clients' engagements
+        (engagement_id, client_id) with the deliverables. They are looked
+        up in the join indexes, so the cost depends on the clients' own
+        engagements and deliverables rather than the table sizes.
+        """
+        engagements_by_client = self._engagements_by_client()
+        deliverables_by_engagement = self._deliverables_by_engagement()
+        eng_positions = [engagements_by_client.get(client_id, NO_ROWS) for client_id in client_ids]
+        eng_positions = np.sort(np.concatenate(eng_positions)) if eng_positions else NO_ROWS
+        owners = self.engagements[['engagement_id', 'client_id']].iloc[eng_positions]
         
-        return at_risk
+        del_positions = [deliverables_by_engagement.get(eid, NO_ROWS) for eid in owners['engagement_id']]
+        counts = [len(positions) for positions in del_positions]
+        del_positions = np.concatenate(del_positions) if del_positions else NO_ROWS
+        deliverables = self.deliverables.iloc[del_positions].drop(columns='engagement_id').reset_index(drop=True)
+        owners = owners.iloc[np.repeat(np.arange(len(owners)), counts)].reset_index(drop=True)
+        return pd.concat([owners, deliverables], axis=1)
     
+    @memoized('clients', 'engagements', 'deliverables', maxsize=256)
     def get_client_summary(self, client_id: str) -> Dict:
-        """Get detailed summary for a specific client"""
-        client = self.clients[self.clients['client_id'] == client_id].iloc[0]
-        client_eng = self.engagements[self.engagements['client_id'] == client_id]
-        client_deliverables = self.deliverables[
-            self.deliverables['engagement_id'].isin(client_eng['engagement_id'])
-        ]
+        """Get detailed summary for a specific client
+        
+        Uses the per-table join indexes, so the cost depends on the client's
+        own engagements and deliverables rather than the table sizes.
+        """
+        position = self._client_positions().get(client_id)
+        if position is None:
+            raise KeyError(f"Unknown client: {client_id}")
+        client = self.clients.iloc[position]
+        
+        eng_positions = self._engagements_by_client().get(client_id, NO_ROWS)
+        client_eng = self.engagements.iloc[eng_positions]
+        
+        deliverables_by_engagement = self._deliverables_by_engagement()
+        del_positions = [deliverables_by_engagement.get(eid, NO_ROWS) for eid in client_eng['engagement_id']]
+        del_positions = np.sort(np.concatenate(del_positions)) if del_positions else NO_ROWS
+        client_deliverables = self.deliverables.iloc[del_positions]
         
         return {
             'client': client.to_dict(),
-            'engagements': client_eng.to_dict('records'),
-            'deliverables': client_deliverables.to_dict('records'),
+            'engagements': client_eng,
+            'deliverables': client_deliverables,
             'total_contract_value': client['contract_value'],
             'total_spent': client_eng['budget_spent'].sum(),
             'total_allocated': client_eng['budget_allocated'].sum(),
-            'active_engagement_count': len(client_eng[client_eng['status'] == 'In Progress']),
-            'completed_engagement_count': len(client_eng[client_eng['status'] == 'Completed']),
+            'active_engagement_count': int((client_eng['status'] == 'In Progress').sum()),
+            'completed_engagement_count': int((client_eng['status'] == 'Completed').sum()),
         }
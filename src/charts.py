@@ -1,9 +1,72 @@
-import streamlit as st
-import plotly.graph_objects as go
-import plotly.express as px
+from __future__ import annotations
+
 import pandas as pd
+import numpy as np
+import threading
+from collections import OrderedDict
 from datetime import datetime
-from typing import Dict, List
+from typing import TYPE_CHECKING, Callable, Dict, List, Tuple
+
+from .profiling import span
+from .startup import lazy_import
+
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
+    import plotly.express as px
+else:
+    # Plotly is imported when the first figure is built, not at app start
+    go = lazy_import('plotly.graph_objects')
+    px = lazy_import('plotly.express')
+
+
+class FigureCache:
+    """LRU cache of built figures keyed by chart, data version and parameters
+    
+    Entries are evicted least recently used first once either max_entries or
+    max_bytes (measured as the figure's serialized JSON size) is exceeded.
+    """
+    
+    def __init__(self, max_entries: int = 128, max_bytes: int = 64 * 2**20):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self.stats = {'hits': 0, 'misses': 0, 'evictions': 0}
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, chart: Callable, data_version: Tuple, build: Callable, **params) -> go.Figure:
+        """Return the cached figure for this chart/version/params, building it on a miss"""
+        key = (chart.__qualname__, data_version, tuple(sorted(params.items())))
+        with span('chart', chart.__qualname__) as record:
+            with self._lock:
+                if key in self._entries:
+                    self.stats['hits'] += 1
+                    record['cache'] = 'hit'
+                    self._entries.move_to_end(key)
+                    return self._entries[key][0]
+                self.stats['misses'] += 1
+            
+            record['cache'] = 'miss'
+            fig = build(**params)
+            size = len(fig.to_json())
+            with self._lock:
+                if key not in self._entries:
+                    self._entries[key] = (fig, size)
+                    self.total_bytes += size
+                self._evict()
+            return fig
+    
+    def _evict(self):
+        while self._entries and (len(self._entries) > self.max_entries or self.total_bytes > self.max_bytes):
+            _, (_, size) = self._entries.popitem(last=False)
+            self.total_bytes -= size
+            self.stats['evictions'] += 1
+    
+    def clear(self):
+        """Drop every cached figure"""
+        with self._lock:
+            self._entries.clear()
+            self.total_bytes = 0
 
 class DashboardCharts:
     """Create dashboard visualizations"""
@@ -47,7 +110,7 @@ class DashboardCharts:
     def engagement_progress_chart(engagement_data: pd.DataFrame) -> go.Figure:
         """Create engagement progress chart"""
         fig = px.bar(
-            engagement_data.sort_values('progress', ascending=False).head(15),
+            engagement_data.nlargest(15, 'progress'),
             x='engagement_name',
             y='progress',
             color='status',
@@ -70,8 +133,41 @@ class DashboardCharts:
         return fig
     
     @staticmethod
-    def budget_utilization_chart(engagement_data: pd.DataFrame) -> go.Figure:
-        """Create budget utilization scatter chart"""
+    def budget_utilization_chart(engagement_data: pd.DataFrame,
+                                 webgl_threshold: int = 1000,
+                                 max_points: int = 20000) -> go.Figure:
+        """Create budget utilization scatter chart
+        
+        Above webgl_threshold engagements the scatter is drawn with WebGL;
+        above max_points it becomes a 2D histogram of the same axes.
+        """
+        labels = {
+            'budget_utilization_pct': 'Budget Utilization (%)',
+            'progress': 'Progress (%)'
+        }
+        
+        if len(engagement_data) > max_points:
+            # Bin server-side so only the grid of counts reaches the browser
+            x = engagement_data['budget_utilization_pct'].to_numpy(float)
+            y = engagement_data['progress'].to_numpy(float)
+            finite = np.isfinite(x) & np.isfinite(y)
+            counts, x_edges, y_edges = np.histogram2d(x[finite], y[finite], bins=[50, 20])
+            
+            fig = go.Figure(go.Heatmap(
+                x=(x_edges[:-1] + x_edges[1:]) / 2,
+                y=(y_edges[:-1] + y_edges[1:]) / 2,
+                z=counts.T,
+                colorscale='Blues',
+                colorbar=dict(title='Engagements')
+            ))
+            fig.update_layout(
+                title=f'Budget Utilization vs Progress ({len(engagement_data):,} engagements)',
+                xaxis_title=labels['budget_utilization_pct'],
+                yaxis_title=labels['progress'],
+                height=400
+            )
+            return fig
+        
         fig = px.scatter(
             engagement_data,
             x='budget_utilization_pct',
@@ -80,16 +176,14 @@ class DashboardCharts:
             color='status',
             hover_name='engagement_name',
             title='Budget Utilization vs Progress',
-            labels={
-                'budget_utilization_pct': 'Budget Utilization (%)',
-                'progress': 'Progress (%)'
-            },
+            labels=labels,
             color_discrete_map={
                 'In Progress': '#3498db',
                 'Completed': '#2ecc71',
                 'On Hold': '#e74c3c',
                 'Paused': '#f39c12'
-            }
+            },
+            render_mode='webgl' if len(engagement_data) > webgl_threshold else 'svg'
         )
         
         fig.update_layout(height=400, hovermode='closest')
@@ -97,14 +191,12 @@ class DashboardCharts:
         return fig
     
     @staticmethod
-    def monthly_revenue_chart(trends_data: pd.DataFrame) -> go.Figure:
-        """Create monthly revenue trend chart"""
-        monthly_rev = trends_data.groupby('date')['revenue_generated'].sum().reset_index()
-        
+    def monthly_revenue_chart(monthly_totals: pd.DataFrame) -> go.Figure:
+        """Create monthly revenue trend chart from one-row-per-month totals"""
         fig = go.Figure()
         fig.add_trace(go.Scatter(
-            x=monthly_rev['date'],
-            y=monthly_rev['revenue_generated'],
+            x=monthly_totals['date'],
+            y=monthly_totals['revenue_generated'],
             mode='lines+markers',
             fill='tozeroy',
             name='Revenue',
@@ -124,14 +216,12 @@ class DashboardCharts:
         return fig
     
     @staticmethod
-    def hours_spent_chart(trends_data: pd.DataFrame) -> go.Figure:
-        """Create monthly hours spent chart"""
-        monthly_hours = trends_data.groupby('date')['hours_spent'].sum().reset_index()
-        
+    def hours_spent_chart(monthly_totals: pd.DataFrame) -> go.Figure:
+        """Create monthly hours spent chart from one-row-per-month totals"""
         fig = go.Figure()
         fig.add_trace(go.Bar(
-            x=monthly_hours['date'],
-            y=monthly_hours['hours_spent'],
+            x=monthly_totals['date'],
+            y=monthly_totals['hours_spent'],
             name='Hours Spent',
             marker=dict(color='#3498db')
         ))
@@ -215,14 +305,12 @@ class DashboardCharts:
         return fig
     
     @staticmethod
-    def satisfaction_trend_chart(trends_data: pd.DataFrame) -> go.Figure:
-        """Create satisfaction score trend"""
-        satisfaction = trends_data.groupby('date')['satisfaction_score'].mean().reset_index()
-        
+    def satisfaction_trend_chart(monthly_totals: pd.DataFrame) -> go.Figure:
+        """Create satisfaction score trend from one-row-per-month totals"""
         fig = go.Figure()
         fig.add_trace(go.Scatter(
-            x=satisfaction['date'],
-            y=satisfaction['satisfaction_score'],
+            x=monthly_totals['date'],
+            y=monthly_totals['satisfaction_score'],
             mode='lines+markers',
             fill='tozeroy',
             name='Satisfaction Score',
@@ -1,68 +1,411 @@
 import pandas as pd
+import numpy as np
 import os
+import sys
+import threading
 from pathlib import Path
-from typing import Dict, List
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
 
-class DataLoader:
-    """Load and cache data from CSV/JSON files"""
+from .profiling import span
+from .storage import ColumnarStore, SharedTableStore, signature_version, source_signature
+
+# Explicit column types for each table. Dates listed under 'optional_dates'
+# may be blank (e.g. deliverables that are not completed yet).
+TABLE_SCHEMAS = {
+    'clients': {
+        'filename': 'clients.csv',
+        'dtypes': {
+            'client_id': 'object',
+            'client_name': 'object',
+            'industry': 'category',
+            'status': 'category',
+            'contract_value': 'int64',
+            'manager': 'object',
+        },
+        'dates': ['start_date'],
+        'optional_dates': [],
+    },
+    'engagements': {
+        'filename': 'engagements.csv',
+        'dtypes': {
+            'engagement_id': 'object',
+            'client_id': 'object',
+            'engagement_name': 'object',
+            'status': 'category',
+            'progress': 'int64',
+            'budget_allocated': 'int64',
+            'budget_spent': 'int64',
+        },
+        'dates': ['start_date', 'end_date'],
+        'optional_dates': [],
+    },
+    'deliverables': {
+        'filename': 'deliverables.csv',
+        'dtypes': {
+            'deliverable_id': 'object',
+            'engagement_id': 'object',
+            'deliverable_name': 'object',
+            'status': 'category',
+            'quality_score': 'float64',
+        },
+        'dates': ['due_date'],
+        'optional_dates': ['completion_date'],
+    },
+    'summaries': {
+        'filename': 'monthly_summaries.csv',
+        'dtypes': {
+            'summary_id': 'object',
+            'client_id': 'object',
+            'month': 'int64',
+            'year': 'int64',
+            'revenue_generated': 'int64',
+            'hours_spent': 'int64',
+            'satisfaction_score': 'float64',
+            'key_milestones': 'object',
+            'risks': 'object',
+        },
+        'dates': [],
+        'optional_dates': [],
+    },
+}
+
+TEXT_DTYPES = ('object', 'category')
+
+
+def hand_out(df: pd.DataFrame) -> pd.DataFrame:
+    """Copy of a cached frame for a caller, so its edits never reach the cache
+
+    Under copy-on-write (always on from pandas 3.0) a shallow copy is
+    enough; without it, shallow copies share the cached arrays and an
+    in-place edit would change them for every session, so the copy is deep.
+    """
+    if int(pd.__version__.split('.')[0]) >= 3 or pd.get_option('mode.copy_on_write') is True:
+        return df.copy(deep=False)
+    return df.copy()
+
+
+def apply_schema(df: pd.DataFrame, schema: Dict) -> pd.DataFrame:
+    """Cast a raw frame to the column types declared in a table schema"""
+    for col, dtype in schema['dtypes'].items():
+        if col not in df.columns or dtype in TEXT_DTYPES:
+            continue
+        values = pd.to_numeric(df[col])
+        # Integer columns with blanks stay float rather than failing the load
+        if dtype == 'int64' and values.isna().any():
+            dtype = 'float64'
+        df[col] = values.astype(dtype)
+
+    for col in schema['dates']:
+        if col in df.columns:
+            df[col] = pd.to_datetime(df[col])
+    for col in schema['optional_dates']:
+        if col in df.columns:
+            df[col] = pd.to_datetime(df[col], errors='coerce')
+
+    return df
+
+
+def validate_columns(df: pd.DataFrame, schema: Dict) -> pd.DataFrame:
+    """Raise ValueError if a frame lacks any column declared in its schema"""
+    expected = list(schema['dtypes']) + schema['dates'] + schema['optional_dates']
+    missing = [col for col in expected if col not in df.columns]
+    if missing:
+        raise ValueError(f"{schema['filename']} is missing columns: {', '.join(missing)}")
+    return df
+
+
+def compact_frame(df: pd.DataFrame, category_max_ratio: float = 0.5) -> pd.DataFrame:
+    """Shrink a typed frame for long-lived in-memory use
     
-    def __init__(self, data_dir: str = "data"):
+    Text columns whose distinct-value ratio is at most category_max_ratio
+    become categoricals (so status filters compare integer codes); other
+    object columns have their strings interned. Integers are downcast to the
+    smallest type that holds them and floats to float32.
+    """
+    df = df.copy(deep=False)
+    for col in df.columns:
+        values = df[col]
+        if isinstance(values.dtype, pd.CategoricalDtype) or pd.api.types.is_datetime64_any_dtype(values):
+            continue
+        if pd.api.types.is_integer_dtype(values):
+            df[col] = pd.to_numeric(values, downcast='integer')
+        elif pd.api.types.is_float_dtype(values):
+            df[col] = values.astype(np.float32)
+        elif pd.api.types.is_object_dtype(values) or pd.api.types.is_string_dtype(values):
+            if len(values) and values.nunique(dropna=False) / len(values) <= category_max_ratio:
+                df[col] = values.astype('category')
+            elif pd.api.types.is_object_dtype(values):
+                df[col] = values.map(lambda v: sys.intern(v) if isinstance(v, str) else v)
+    return df
+
+
+class DataLoader:
+    """Load and cache data from CSV/JSON files
+
+    Cache entries hold the fully typed frame together with the mtime/size
+    signature of the file it came from, so an edited file is picked up on
+    the next call without an explicit refresh().
+    """
+
+    def __init__(self, data_dir: str = "data", cache_dir: Optional[str] = None,
+                 columnar: bool = True, compact: bool = False,
+                 category_max_ratio: float = 0.5,
+                 stream_min_bytes: int = 64 * 2**20, chunk_rows: int = 200_000,
+                 shared_dir: Optional[str] = None):
         self.data_dir = Path(data_dir)
         self.cache = {}
-    
-    def load_csv(self, filename: str) -> pd.DataFrame:
-        """Load CSV file and cache it"""
-        if filename in self.cache:
-            return self.cache[filename]
-        
+        self.compact = compact
+        self.category_max_ratio = category_max_ratio
+        self.memory_usage = {}
+        self.stream_min_bytes = stream_min_bytes
+        self.chunk_rows = chunk_rows
+        self._lock = threading.RLock()
+        self.store = None
+        if columnar and ColumnarStore.available():
+            self.store = ColumnarStore(cache_dir or self.data_dir / ".cache")
+        self.shared = None
+        if shared_dir and ColumnarStore.available():
+            self.shared = SharedTableStore(shared_dir)
+
+    def _filepath(self, filename: str) -> Path:
         filepath = self.data_dir / filename
         if not filepath.exists():
             raise FileNotFoundError(f"File not found: {filepath}")
-        
-        df = pd.read_csv(filepath)
-        self.cache[filename] = df
-        return df
-    
+        return filepath
+
+    def _table_for(self, filename: str) -> Optional[str]:
+        for name, schema in TABLE_SCHEMAS.items():
+            if schema['filename'] == filename:
+                return name
+        return None
+
+    def _cached(self, key: str, signature: Dict):
+        entry = self.cache.get(key)
+        if entry is not None and entry[0] == signature:
+            return entry[1]
+        return None
+
+    def is_stale(self, name: str) -> bool:
+        """Whether a table's source file changed since it was cached"""
+        schema = TABLE_SCHEMAS[name]
+        filepath = self._filepath(schema['filename'])
+        return self._cached(name, source_signature(filepath)) is None
+
+    def load_table(self, name: str, progress: Optional[Callable] = None) -> pd.DataFrame:
+        """Load a typed table, preferring the columnar cache over the CSV
+
+        Returns a copy (see hand_out()); modifying it never changes the cache.
+        CSV files of at least stream_min_bytes are ingested in chunks, with
+        progress(name, bytes_read, total_bytes) called after each chunk.
+        """
+        return self.load_versioned(name, progress)[1]
+
+    def load_versioned(self, name: str, progress: Optional[Callable] = None) -> Tuple[str, pd.DataFrame]:
+        """Load a table together with its version token
+
+        The token changes whenever the source file does, so it can key any
+        cache derived from the table.
+        """
+        schema = TABLE_SCHEMAS[name]
+        filepath = self._filepath(schema['filename'])
+
+        with span('loader', name) as record, self._lock:
+            signature = source_signature(filepath)
+            version = signature_version(signature)
+            df = self._cached(name, signature)
+            if df is not None:
+                record['source'] = 'memory'
+                return version, hand_out(df)
+
+            # A version published to the shared store is mapped, not parsed
+            record['source'] = 'shared'
+            df = self.shared.read(name, signature) if self.shared else None
+            if df is None:
+                record['source'] = 'parquet'
+                df = self.store.read(name, signature) if self.store else None
+            if df is None and self.store and signature['size'] >= self.stream_min_bytes:
+                record['source'] = 'chunked csv'
+                self._ingest_chunked(name, filepath, signature, progress)
+                df = self.store.read(name, signature)
+            if df is None:
+                record['source'] = 'csv'
+                df = apply_schema(validate_columns(self._read_csv(filepath, schema), schema), schema)
+                if self.store:
+                    self.store.write(name, df, signature)
+
+            # Measured here only when compacting, as the uncompacted frame is
+            # about to be dropped; memory_report() measures the rest on demand
+            self.memory_usage.pop(name, None)
+            if self.compact:
+                before = int(df.memory_usage(deep=True).sum())
+                df = compact_frame(df, self.category_max_ratio)
+                self.memory_usage[name] = (before, int(df.memory_usage(deep=True).sum()))
+
+            self.cache[name] = (signature, df)
+            return version, hand_out(df)
+
+    def publish_shared(self, names: Optional[List[str]] = None) -> List[str]:
+        """Publish the current version of tables (all by default) to the shared store
+
+        Meant for a single writer such as the pre-computation worker; returns
+        the names of the tables that had a new version to publish.
+        """
+        published = []
+        for name in TABLE_SCHEMAS if names is None else names:
+            with self._lock:
+                df = self.load_table(name)
+                signature = self.cache[name][0]
+            if self.shared.publish(name, df, signature):
+                published.append(name)
+        return published
+
+    def load_tables(self, names: Optional[List[str]] = None,
+                    progress: Optional[Callable] = None) -> Dict[str, Tuple[str, pd.DataFrame]]:
+        """Load several tables (all by default) as {name: (version, frame)}"""
+        names = TABLE_SCHEMAS if names is None else names
+        return {name: self.load_versioned(name, progress) for name in names}
+
+    def _read_csv(self, filepath: Path, schema: Dict, **kwargs):
+        text_dtypes = {col: dtype for col, dtype in schema['dtypes'].items()
+                       if dtype in TEXT_DTYPES}
+        return pd.read_csv(filepath, dtype=text_dtypes, **kwargs)
+
+    def _ingest_chunked(self, name: str, filepath: Path, signature: Dict,
+                        progress: Optional[Callable] = None):
+        """Stream a large CSV into the columnar cache chunk by chunk"""
+        self.store.write_chunks(name, self.iter_chunks(name, progress), signature)
+
+    def table_version(self, name: str) -> str:
+        """Version token of a table's source file, without loading it"""
+        signature = source_signature(self._filepath(TABLE_SCHEMAS[name]['filename']))
+        return signature_version(signature)
+
+    def iter_chunks(self, name: str, progress: Optional[Callable] = None) -> Iterator[pd.DataFrame]:
+        """Read a table's CSV as typed chunks of chunk_rows rows, bypassing the cache
+
+        Only one chunk is held in memory at a time; progress(name, bytes_read,
+        total_bytes) is called after each chunk.
+        """
+        schema = TABLE_SCHEMAS[name]
+        filepath = self._filepath(schema['filename'])
+        total = filepath.stat().st_size
+
+        with open(filepath, 'rb') as f:
+            for number, chunk in enumerate(self._read_csv(f, schema, chunksize=self.chunk_rows)):
+                try:
+                    yield apply_schema(validate_columns(chunk, schema), schema)
+                except ValueError as e:
+                    raise ValueError(f"{schema['filename']}, chunk {number + 1}: {e}") from e
+                if progress:
+                    progress(name, min(f.tell(), total), total)
+
+    def iter_batches(self, name: str, rows: Optional[int] = None) -> Tuple[str, Iterator[pd.DataFrame]]:
+        """A table's version and an iterator over it in typed batches
+
+        Batches of rows rows (default chunk_rows) come from the columnar
+        cache when it is current, otherwise from the CSV in chunk_rows
+        chunks, so only one batch is in memory at a time.
+        """
+        schema = TABLE_SCHEMAS[name]
+        signature = source_signature(self._filepath(schema['filename']))
+        version = signature_version(signature)
+        batches = self.store.read_batches(name, signature, rows or self.chunk_rows) if self.store else None
+        return version, batches if batches is not None else self.iter_chunks(name)
+
+    def memory_report(self) -> pd.DataFrame:
+        """Memory used by each loaded table before and after compaction"""
+        rows = []
+        for name in TABLE_SCHEMAS:
+            if name not in self.cache:
+                continue
+            usage = self.memory_usage.get(name)
+            if usage is None:
+                size = int(self.cache[name][1].memory_usage(deep=True).sum())
+                usage = self.memory_usage[name] = (size, size)
+            rows.append({'table': name, 'before_mb': usage[0] / 2**20, 'after_mb': usage[1] / 2**20})
+        report = pd.DataFrame(rows, columns=['table', 'before_mb', 'after_mb'])
+        report['saved_pct'] = (1 - report['after_mb'] / report['before_mb']) * 100
+        return report.round(3)
+
+    def reload_changed(self) -> List[str]:
+        """Reload only the loaded tables whose source file changed
+
+        Returns the names of the reloaded tables so callers can invalidate
+        whatever was derived from them.
+        """
+        with self._lock:
+            changed = [name for name in TABLE_SCHEMAS
+                       if name in self.cache and self.is_stale(name)]
+            for name in changed:
+                self.load_table(name)
+        return changed
+
+    def load_csv(self, filename: str) -> pd.DataFrame:
+        """Load CSV file and cache it"""
+        table = self._table_for(filename)
+        if table is not None:
+            return self.load_table(table)
+
+        filepath = self._filepath(filename)
+        signature = source_signature(filepath)
+        df = self._cached(filename, signature)
+        if df is None:
+            df = pd.read_csv(filepath)
+            self.cache[filename] = (signature, df)
+        return hand_out(df)
+
     def load_json(self, filename: str) -> Dict:
         """Load JSON file and cache it"""
-        if filename in self.cache:
-            return self.cache[filename]
-        
-        filepath = self.data_dir / filename
-        if not filepath.exists():
-            raise FileNotFoundError(f"File not found: {filepath}")
-        
+        filepath = self._filepath(filename)
+        signature = source_signature(filepath)
+        data = self._cached(filename, signature)
+        if data is not None:
+            return data
+
         import json
         with open(filepath, 'r') as f:
             data = json.load(f)
-        
-        self.cache[filename] = data
+
+        self.cache[filename] = (signature, data)
         return data
-    
+
     def get_clients(self) -> pd.DataFrame:
         """Load clients data"""
-        df = self.load_csv("clients.csv")
-        df['start_date'] = pd.to_datetime(df['start_date'])
-        return df
-    
+        return self.load_table('clients')
+
+    def get_client_labels(self) -> pd.Series:
+        """Display label ("Name (ID)") for each client, indexed by client_id
+
+        Sorted by client name and rebuilt only when clients.csv changes, so
+        pickers can look up and search labels without scanning the table.
+        """
+        filepath = self._filepath(TABLE_SCHEMAS['clients']['filename'])
+        with self._lock:
+            signature = source_signature(filepath)
+            labels = self._cached('client_labels', signature)
+            if labels is None:
+                clients = self.get_clients().sort_values('client_name')
+                labels = pd.Series(
+                    (clients['client_name'].astype(str) + ' (' + clients['client_id'].astype(str) + ')').values,
+                    index=clients['client_id'].values,
+                    name='label'
+                )
+                self.cache['client_labels'] = (signature, labels)
+        return labels
+
     def get_engagements(self) -> pd.DataFrame:
         """Load engagements data"""
-        df = self.load_csv("engagements.csv")
-        df['start_date'] = pd.to_datetime(df['start_date'])
-        df['end_date'] = pd.to_datetime(df['end_date'])
-        return df
-    
+        return self.load_table('engagements')
+
     def get_deliverables(self) -> pd.DataFrame:
         """Load deliverables data"""
-        df = self.load_csv("deliverables.csv")
-        df['due_date'] = pd.to_datetime(df['due_date'])
-        df['completion_date'] = pd.to_datetime(df['completion_date'], errors='coerce')
-        return df
-    
+        return self.load_table('deliverables')
+
     def get_monthly_summaries(self) -> pd.DataFrame:
         """Load monthly summaries data"""
-        return self.load_csv("monthly_summaries.csv")
-    
+        return self.load_table('summaries')
+
     def refresh(self):
         """Clear cache and reload all data"""
-        self.cache.clear()
+        with self._lock:
+            self.cache.clear()
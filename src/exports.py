@@ -0,0 +1,164 @@
+"""
+Chunked, optionally compressed exports of report tables
+
+Downloads are written to disk one chunk at a time, as CSV (plain, gzip, or
+zstd when the zstandard package is installed) or Parquet, and kept in an
+ExportCache keyed by the version of the data they came from, so repeated
+downloads of unchanged data reuse the same file.
+"""
+
+import gzip
+import hashlib
+import os
+import threading
+from collections import namedtuple
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, List
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - pyarrow ships with streamlit
+    pa = None
+    pq = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+ExportFormat = namedtuple('ExportFormat', ['label', 'extension', 'mime'])
+
+EXPORT_FORMATS = {
+    'csv': ExportFormat('CSV', '.csv', 'text/csv'),
+    'csv.gz': ExportFormat('CSV (gzip)', '.csv.gz', 'application/gzip'),
+    'csv.zst': ExportFormat('CSV (zstd)', '.csv.zst', 'application/zstd'),
+    'parquet': ExportFormat('Parquet', '.parquet', 'application/vnd.apache.parquet'),
+}
+
+
+def available_formats() -> List[str]:
+    """Export formats whose libraries are installed"""
+    formats = ['csv', 'csv.gz']
+    if zstandard is not None:
+        formats.append('csv.zst')
+    if pq is not None:
+        formats.append('parquet')
+    return formats
+
+
+def frame_chunks(df: pd.DataFrame, rows: int) -> Iterator[pd.DataFrame]:
+    """Consecutive row slices of a frame (views, not copies)"""
+    for start in range(0, max(len(df), 1), rows):
+        yield df.iloc[start:start + rows]
+
+
+def write_csv(chunks: Iterable[pd.DataFrame], path: Path, compression: str = None):
+    """Write chunks as one CSV file, compressing as it goes ('gzip' or 'zstd')"""
+    if compression == 'gzip':
+        f = gzip.open(path, 'wt', newline='', compresslevel=6)
+    elif compression == 'zstd':
+        raw = open(path, 'wb')
+        f = zstandard.ZstdCompressor().stream_writer(raw, closefd=True)
+        f = _TextWriter(f)
+    else:
+        f = open(path, 'w', newline='')
+    with f:
+        for number, chunk in enumerate(chunks):
+            chunk.to_csv(f, index=False, header=number == 0)
+
+
+class _TextWriter:
+    """Minimal text adapter over a binary stream, for to_csv"""
+
+    def __init__(self, raw):
+        self.raw = raw
+
+    def write(self, text: str):
+        return self.raw.write(text.encode('utf-8'))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.raw.close()
+
+
+def write_parquet(chunks: Iterable[pd.DataFrame], path: Path):
+    """Write chunks as one Parquet file, one row group per chunk
+
+    The schema is fixed by the first chunk, with categoricals widened to
+    int32 dictionaries and all-null columns typed as strings, as in the
+    columnar cache.
+    """
+    writer = None
+    try:
+        for chunk in chunks:
+            if writer is None:
+                fields = []
+                for field in pa.Schema.from_pandas(chunk, preserve_index=False):
+                    if pa.types.is_dictionary(field.type):
+                        field = field.with_type(pa.dictionary(pa.int32(), field.type.value_type))
+                    elif pa.types.is_null(field.type):
+                        field = field.with_type(pa.string())
+                    fields.append(field)
+                writer = pq.ParquetWriter(path, pa.schema(fields), compression='zstd')
+            writer.write_table(pa.Table.from_pandas(chunk, schema=writer.schema, preserve_index=False))
+    finally:
+        if writer is not None:
+            writer.close()
+
+
+class ExportCache:
+    """Export files on disk, reused until the data they were built from changes
+
+    Exports are keyed by name, data version and format, and written chunk by
+    chunk to a temporary file that is renamed into place, so building one
+    holds a single chunk in memory and readers never see a partial file.
+    Building a new version removes the older files of the same export.
+    """
+
+    def __init__(self, cache_dir):
+        self.cache_dir = Path(cache_dir)
+        self._locks = {}
+        self._lock = threading.Lock()
+
+    def path_for(self, name: str, version: str, fmt: str) -> Path:
+        digest = hashlib.sha1(version.encode()).hexdigest()[:12]
+        return self.cache_dir / f"{name}-{digest}{EXPORT_FORMATS[fmt].extension}"
+
+    def get(self, name: str, version: str, fmt: str, chunks: Callable[[], Iterable[pd.DataFrame]]) -> Path:
+        """Path of the export, building it from chunks() if this version is not cached"""
+        path = self.path_for(name, version, fmt)
+        with self._lock:
+            lock = self._locks.setdefault((name, fmt), threading.Lock())
+
+        # One build per export at a time; other sessions wait and reuse it
+        with lock:
+            if path.exists():
+                return path
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+            try:
+                if fmt == 'parquet':
+                    write_parquet(chunks(), tmp_path)
+                else:
+                    write_csv(chunks(), tmp_path, {'csv.gz': 'gzip', 'csv.zst': 'zstd'}.get(fmt))
+            except BaseException:
+                tmp_path.unlink(missing_ok=True)
+                raise
+            os.replace(tmp_path, path)
+
+            for old in self.cache_dir.glob(f"{name}-*{EXPORT_FORMATS[fmt].extension}"):
+                if old != path and len(old.name) == len(path.name):
+                    old.unlink(missing_ok=True)
+        return path
+
+    def clear(self):
+        """Remove every cached export"""
+        if self.cache_dir.exists():
+            for path in self.cache_dir.iterdir():
+                if path.is_file():
+                    path.unlink()
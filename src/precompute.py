@@ -0,0 +1,232 @@
+"""
+Pre-computation worker for the dashboard's derived tables
+
+Builds client health, engagement performance, the monthly trends and
+rollups and the at-risk index in a process pool, one result per process,
+and publishes them as a versioned snapshot of uncompressed Arrow IPC files.
+Dashboard processes memory-map those files (SnapshotReader) instead of
+recomputing the same aggregates in every session. The worker is also the
+single writer of the shared table store, which dashboards map instead of
+each parsing its own copy of the source tables:
+
+    python -m src.precompute [--workers N] [--watch SECONDS]
+
+A snapshot is written to its own <snapshot_dir>/<id>/ directory and only becomes visible once
+the CURRENT pointer file is atomically replaced, so readers never see a
+half-written snapshot.
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import os
+import shutil
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+import pandas as pd
+
+import config
+
+try:
+    import pyarrow as pa
+except ImportError:  # pragma: no cover - pyarrow ships with streamlit
+    pa = None
+
+from .analyzer import DEPENDENCIES, TABLES, DataAnalyzer, snapshot_settings
+from .data_loader import DataLoader
+from .storage import read_arrow, write_arrow
+
+logger = logging.getLogger(__name__)
+
+# Memoized DataAnalyzer methods whose results are precomputed
+SNAPSHOT_METHODS = [
+    'get_client_health',
+    '_engagement_performance',
+    '_client_month_rollup',
+    'get_monthly_rollup',
+    'get_monthly_totals',
+    'get_monthly_trends',
+    '_at_risk_index',
+]
+
+CURRENT_FILE = 'CURRENT'
+MANIFEST_FILE = 'manifest.json'
+
+# Snapshots kept on disk besides the current one, for readers still mapping them
+KEEP_SNAPSHOTS = 2
+
+
+def snapshot_id(versions: Dict[str, str], settings: Dict) -> str:
+    """Identifier of the snapshot built from the given table versions and analyzer settings"""
+    key = {'versions': versions, 'settings': settings}
+    return hashlib.sha1(json.dumps(key, sort_keys=True).encode()).hexdigest()[:16]
+
+
+def build_result(data_dir: str, name: str, versions: Dict[str, str], out_dir: str,
+                 shared_dir: Optional[str] = None, health_weights: Optional[Dict] = None,
+                 compact: bool = False) -> str:
+    """Compute one analyzer result and write it to out_dir (runs in a worker process)"""
+    loader = DataLoader(data_dir=data_dir, shared_dir=shared_dir, compact=compact)
+    analyzer = DataAnalyzer(table_source=loader.load_versioned, health_weights=health_weights, compact=compact)
+    result = getattr(analyzer, name)()
+    for table in DEPENDENCIES[name]:
+        if analyzer.versions.get(table) != versions[table]:
+            raise RuntimeError(f"{table} changed while building {name}")
+
+    if name == '_at_risk_index':
+        result = result.to_frame()
+    write_arrow(result, Path(out_dir) / f"{name}.arrow")
+    return name
+
+
+def publish(data_dir: str = "data", snapshot_dir: str = "data/.snapshots",
+            workers: Optional[int] = None, force: bool = False,
+            shared_dir: Optional[str] = None, health_weights: Optional[Dict] = None,
+            compact: Optional[bool] = None) -> Optional[str]:
+    """Build and publish a snapshot unless the current one is up to date
+
+    Results are built with the given health weights and memory profile
+    (config's by default); dashboards only use a snapshot built with their
+    own. With shared_dir, changed source tables are first published there
+    for dashboard processes (and this build's workers) to map. Returns the
+    new snapshot id, or None if nothing had to be built.
+    """
+    health_weights = health_weights or config.HEALTH_SCORE_WEIGHTS
+    compact = config.COMPACT_MEMORY_PROFILE if compact is None else compact
+    settings = snapshot_settings(health_weights, compact)
+    loader = DataLoader(data_dir=data_dir, shared_dir=shared_dir)
+    if shared_dir:
+        for name in loader.publish_shared():
+            logger.info("Published %s to %s", name, shared_dir)
+    versions = {name: loader.table_version(name) for name in TABLES}
+    root = Path(snapshot_dir)
+    current = root / CURRENT_FILE
+    if not force and current.exists() and current.read_text().strip().startswith(snapshot_id(versions, settings)):
+        return None
+
+    # A fresh directory per build, so a forced rebuild never touches the one being read
+    new_id = f"{snapshot_id(versions, settings)}-{time.time_ns()}"
+    out_dir = root / new_id
+    out_dir.mkdir(parents=True)
+    try:
+        # Warm the shared Parquet cache once so workers do not all parse the CSVs
+        for name in TABLES:
+            loader.load_versioned(name)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(build_result, data_dir, name, versions, str(out_dir), shared_dir,
+                                   health_weights, compact)
+                       for name in SNAPSHOT_METHODS]
+            for future in futures:
+                future.result()
+
+        manifest = {'versions': versions, 'settings': settings, 'results': SNAPSHOT_METHODS, 'created': time.time()}
+        (out_dir / MANIFEST_FILE).write_text(json.dumps(manifest, indent=2))
+    except BaseException:
+        # Never leave a partial snapshot behind; the next call starts over
+        shutil.rmtree(out_dir, ignore_errors=True)
+        raise
+
+    tmp_current = current.with_suffix(f".{os.getpid()}.tmp")
+    tmp_current.write_text(new_id)
+    os.replace(tmp_current, current)
+    prune(root, keep=KEEP_SNAPSHOTS)
+    return new_id
+
+
+def prune(root: Path, keep: int = KEEP_SNAPSHOTS):
+    """Delete all but the newest keep snapshots besides the current one"""
+    current = (root / CURRENT_FILE).read_text().strip()
+    old = sorted((path for path in root.iterdir() if path.is_dir() and path.name != current),
+                 key=lambda path: path.stat().st_mtime, reverse=True)
+    for path in old[keep:]:
+        shutil.rmtree(path, ignore_errors=True)
+
+
+class SnapshotReader:
+    """Read results from the current published snapshot
+
+    load() is meant as DataAnalyzer's snapshot_source. The manifest is
+    re-read only when the CURRENT pointer changes.
+    """
+
+    def __init__(self, snapshot_dir: str = "data/.snapshots"):
+        self.root = Path(snapshot_dir)
+        self._current = None
+        self._manifest = None
+        self._lock = threading.Lock()
+
+    def manifest(self) -> Optional[Dict]:
+        """Manifest of the current snapshot, or None if none is published"""
+        try:
+            current = (self.root / CURRENT_FILE).read_text().strip()
+        except OSError:
+            return None
+        with self._lock:
+            if current != self._current:
+                try:
+                    manifest = json.loads((self.root / current / MANIFEST_FILE).read_text())
+                except (OSError, ValueError):
+                    return None
+                self._current = current
+                self._manifest = dict(manifest, id=current)
+            return self._manifest
+
+    def load(self, name: str) -> Optional[Tuple[Dict[str, str], Dict, pd.DataFrame]]:
+        """(table_versions, settings, frame) of a precomputed result, or None"""
+        manifest = self.manifest()
+        if pa is None or manifest is None or name not in manifest['results']:
+            return None
+        try:
+            frame = read_arrow(self.root / manifest['id'] / f"{name}.arrow")
+            return manifest['versions'], manifest.get('settings'), frame
+        except (OSError, pa.ArrowException):
+            # Pruned under us; the caller computes the result itself
+            return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Precompute dashboard analytics into Arrow snapshots")
+    parser.add_argument('--data-dir', default='data')
+    parser.add_argument('--snapshot-dir', default=None,
+                        help="where snapshots are written (default: <data-dir>/.snapshots)")
+    parser.add_argument('--workers', type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument('--watch', type=float, metavar='SECONDS',
+                        help="keep running, checking for changed CSVs every SECONDS")
+    parser.add_argument('--shared-dir', default=None,
+                        help="where source tables are published for dashboards to map (default: <data-dir>/.shared)")
+    parser.add_argument('--no-shared', action='store_true', help="do not publish source tables")
+    parser.add_argument('--force', action='store_true', help="rebuild even if the snapshot is current")
+    args = parser.parse_args(argv)
+    snapshot_dir = args.snapshot_dir or os.path.join(args.data_dir, '.snapshots')
+    shared_dir = None if args.no_shared else args.shared_dir or os.path.join(args.data_dir, '.shared')
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s %(message)s')
+
+    while True:
+        start = time.perf_counter()
+        try:
+            built = publish(args.data_dir, snapshot_dir, args.workers, args.force, shared_dir)
+        except Exception:
+            # A CSV rewritten mid-build or a failed worker; --watch retries on the next tick
+            logger.exception("Snapshot build failed")
+            if args.watch is None:
+                return 1
+        else:
+            if built:
+                logger.info("Published snapshot %s in %.1fs", built, time.perf_counter() - start)
+            elif args.watch is None:
+                logger.info("Snapshot is up to date")
+            if args.watch is None:
+                return 0
+            args.force = False
+        time.sleep(args.watch)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,124 @@
+"""
+Timing spans for the dashboard's hot paths
+
+Loader, analyzer, chart and render calls are wrapped in span(). While a run
+is active on the current thread (begin_run() at the top of a Streamlit
+rerun, end_run() at the bottom) each span is recorded with its own time,
+excluding nested spans, so a rerun can be broken down by category. Outside
+a run, span() only costs a thread-local lookup.
+
+Finished runs are kept in memory for the Performance page and can also be
+appended to a JSONL file for offline analysis.
+"""
+
+import functools
+import json
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional
+
+# Finished runs, newest last
+runs = deque(maxlen=50)
+
+_local = threading.local()
+_lock = threading.Lock()
+
+
+class Run:
+    """Spans recorded during one rerun of one page"""
+
+    def __init__(self, page: str):
+        self.page = page
+        self.started = time.time()
+        self._start = time.perf_counter()
+        self.total_ms = None
+        self.spans = []
+        self.stack = []
+
+    def to_dict(self) -> Dict:
+        return {'page': self.page, 'started': self.started, 'total_ms': self.total_ms, 'spans': self.spans}
+
+
+def begin_run(page: str) -> Run:
+    """Start recording spans on this thread, dropping any unfinished run"""
+    _local.run = Run(page)
+    return _local.run
+
+
+def end_run(export_path: Optional[str] = None) -> Optional[Dict]:
+    """Finish this thread's run, keep it, and append it to export_path if given"""
+    run = getattr(_local, 'run', None)
+    if run is None:
+        return None
+    _local.run = None
+    run.total_ms = round((time.perf_counter() - run._start) * 1000, 3)
+    record = run.to_dict()
+    with _lock:
+        runs.append(record)
+        if export_path:
+            with open(export_path, 'a') as f:
+                f.write(json.dumps(record, default=str) + '\n')
+    return record
+
+
+@contextmanager
+def span(category: str, name: str):
+    """Time the block as a span; the yielded dict takes extra fields (e.g. cache='hit')"""
+    run = getattr(_local, 'run', None)
+    if run is None:
+        yield {}
+        return
+
+    record = {'category': category, 'name': name, 'depth': len(run.stack)}
+    child_ms = [0.0]
+    run.stack.append(child_ms)
+    start = time.perf_counter()
+    try:
+        yield record
+    finally:
+        ms = (time.perf_counter() - start) * 1000
+        run.stack.pop()
+        if run.stack:
+            run.stack[-1][0] += ms
+        record['offset_ms'] = round((start - run._start) * 1000, 3)
+        record['ms'] = round(ms, 3)
+        record['self_ms'] = round(ms - child_ms[0], 3)
+        run.spans.append(record)
+
+
+def timed(category: str, name: Optional[str] = None) -> Callable:
+    """Decorator recording each call of a function as a span"""
+    def decorator(func):
+        label = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(category, label):
+                return func(*args, **kwargs)
+
+        return wrapper
+    return decorator
+
+
+def recent_runs() -> List[Dict]:
+    """Finished runs, newest first"""
+    with _lock:
+        return list(reversed(runs))
+
+
+def breakdown(run: Dict) -> List[Dict]:
+    """Self time per category for one run, slowest first, plus unattributed time"""
+    totals = {}
+    for record in run['spans']:
+        totals[record['category']] = totals.get(record['category'], 0.0) + record['self_ms']
+    totals['other'] = max(run['total_ms'] - sum(totals.values()), 0.0)
+    return sorted(({'category': category, 'ms': round(ms, 1)} for category, ms in totals.items()),
+                  key=lambda row: row['ms'], reverse=True)
+
+
+def hit_rate(stats: Dict) -> Optional[float]:
+    """Share of lookups served from cache, from a {'hits', 'misses'} counter"""
+    lookups = stats.get('hits', 0) + stats.get('misses', 0)
+    return stats.get('hits', 0) / lookups if lookups else None
@@ -0,0 +1,272 @@
+"""
+Headless batch generation of the dashboard's reports
+
+Renders the four report types of the Reports page, portfolio-wide and for
+every client, in a process pool. Client reports are built in batches of
+clients; each batch's rows are appended to the output files as soon as it
+is done, so memory stays bounded by a few batches whatever the portfolio size:
+
+    python -m src.reports [--format csv|xlsx] [--out DIR] [--workers N]
+
+Each report is written to <out>/<report>/, as portfolio.* and clients.*
+(one XLSX workbook with a sheet per section, or one CSV file per section).
+"""
+
+import argparse
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from .analyzer import DataAnalyzer
+from .data_loader import DataLoader
+
+# Rows per worksheet before an XLSX section continues on a new sheet
+XLSX_MAX_ROWS = 1_048_575
+
+
+def _restrict(df: pd.DataFrame, analyzer: DataAnalyzer, result: str,
+              client_ids: Optional[Sequence[str]]) -> pd.DataFrame:
+    """Rows of the given clients, looked up in the analyzer's client_id index for result"""
+    if client_ids is None:
+        return df
+    return df.iloc[analyzer.client_rows(result, client_ids)]
+
+
+def _client_engagements(analyzer: DataAnalyzer) -> pd.DataFrame:
+    """Engagement performance with the columns the financial report shows"""
+    return analyzer.get_engagement_performance(
+        ['engagement_id', 'client_id', 'engagement_name', 'budget_allocated', 'budget_spent', 'budget_utilization_pct']
+    )
+
+
+def health_report(analyzer: DataAnalyzer, client_ids=None) -> Dict[str, pd.DataFrame]:
+    """Client health scores"""
+    return {'health_scores': _restrict(analyzer.get_client_health(), analyzer, 'client_health', client_ids)}
+
+
+def financial_report(analyzer: DataAnalyzer, client_ids=None) -> Dict[str, pd.DataFrame]:
+    """Contract value, budget and revenue"""
+    engagements = _restrict(_client_engagements(analyzer), analyzer, 'engagements', client_ids)
+    if client_ids is None:
+        totals = pd.DataFrame([{
+            'total_contract_value': analyzer.clients['contract_value'].sum(),
+            'total_allocated': engagements['budget_allocated'].sum(),
+            'total_spent': engagements['budget_spent'].sum(),
+        }])
+        revenue = analyzer.get_monthly_totals()[['date', 'revenue_generated', 'hours_spent']]
+    else:
+        budgets = engagements.groupby('client_id', sort=False, observed=True)[['budget_allocated', 'budget_spent']].sum()
+        totals = _restrict(analyzer.clients, analyzer, 'clients', client_ids)[['client_id', 'client_name', 'contract_value']]
+        totals = totals.merge(budgets, left_on='client_id', right_index=True, how='left').fillna(
+            {'budget_allocated': 0, 'budget_spent': 0})
+        rollup = _restrict(analyzer.get_monthly_rollup(), analyzer, 'monthly_rollup', client_ids)
+        revenue = rollup[['date', 'client_id', 'revenue_generated', 'hours_spent']]
+    return {'totals': totals, 'engagements': engagements, 'monthly_revenue': revenue}
+
+
+def deliverable_report(analyzer: DataAnalyzer, client_ids=None) -> Dict[str, pd.DataFrame]:
+    """Deliverables and their completion status"""
+    if client_ids is None:
+        deliverables = analyzer.deliverables
+    else:
+        deliverables = analyzer.get_client_deliverables(client_ids)
+    keys = ['status'] if client_ids is None else ['client_id', 'status']
+    status_counts = deliverables.groupby(keys, observed=True).size().reset_index(name='deliverables')
+    return {'status_counts': status_counts, 'deliverables': deliverables}
+
+
+def satisfaction_report(analyzer: DataAnalyzer, client_ids=None) -> Dict[str, pd.DataFrame]:
+    """Client satisfaction by month"""
+    if client_ids is None:
+        rollup = analyzer.get_monthly_rollup()
+        monthly = analyzer.get_monthly_totals()[['date', 'satisfaction_score']]
+        average = pd.DataFrame([{'average_satisfaction': rollup['satisfaction_sum'].sum() / rollup['satisfaction_count'].sum()}])
+        return {'average': average, 'monthly': monthly}
+
+    rollup = _restrict(analyzer.get_monthly_rollup(), analyzer, 'monthly_rollup', client_ids)
+    monthly = rollup[['date', 'client_id']].assign(
+        satisfaction_score=rollup['satisfaction_sum'] / rollup['satisfaction_count'].replace(0, np.nan))
+    sums = rollup.groupby('client_id', sort=False, observed=True)[['satisfaction_sum', 'satisfaction_count']].sum()
+    average = (sums['satisfaction_sum'] / sums['satisfaction_count'].replace(0, np.nan)).rename('average_satisfaction')
+    return {'average': average.reset_index(), 'monthly': monthly}
+
+
+# Report types of the Reports page -> builder(analyzer, client_ids) -> {section: frame}
+REPORT_BUILDERS: Dict[str, Callable] = {
+    "Health Score Report": health_report,
+    "Financial Summary": financial_report,
+    "Deliverable Status": deliverable_report,
+    "Client Satisfaction": satisfaction_report,
+}
+
+
+def report_slug(report: str) -> str:
+    return report.lower().replace(' ', '_')
+
+
+# ---- Worker side: one analyzer per process, reused across batches ----
+
+_worker = {}
+
+
+def _init_worker(data_dir: str, versions: Dict[str, str], shared_dir: Optional[str] = None):
+    loader = DataLoader(data_dir=data_dir, shared_dir=shared_dir)
+    _worker['analyzer'] = DataAnalyzer(table_source=loader.load_versioned)
+    _worker['versions'] = versions
+
+
+def build_batch(reports: List[str], client_ids: Optional[List[str]]) -> Dict[str, Dict[str, pd.DataFrame]]:
+    """Build the given reports for a batch of clients (None: portfolio-wide)"""
+    analyzer = _worker['analyzer']
+    result = {report: REPORT_BUILDERS[report](analyzer, client_ids) for report in reports}
+    for table, version in analyzer.versions.items():
+        if _worker['versions'].get(table) != version:
+            raise RuntimeError(f"{table} changed while reports were being built")
+    return result
+
+
+# ---- Output ----
+
+class ReportWriter:
+    """Append report sections to CSV or XLSX files as they arrive"""
+
+    def __init__(self, out_dir, fmt: str = 'csv'):
+        if fmt not in ('csv', 'xlsx'):
+            raise ValueError(f"Unknown report format: {fmt}")
+        self.out_dir = Path(out_dir)
+        self.fmt = fmt
+        self._csv = {}        # (report, scope, section) -> open file
+        self._books = {}      # (report, scope) -> write-only workbook
+        self._sheets = {}     # (report, scope, section) -> [worksheet, rows, sheet count]
+
+    def write(self, report: str, scope: str, section: str, df: pd.DataFrame):
+        folder = self.out_dir / report_slug(report)
+        folder.mkdir(parents=True, exist_ok=True)
+        if self.fmt == 'csv':
+            self._write_csv(folder, (report, scope, section), df)
+        else:
+            self._write_xlsx((report, scope, section), df)
+
+    def _write_csv(self, folder: Path, key, df: pd.DataFrame):
+        f = self._csv.get(key)
+        header = f is None
+        if header:
+            f = self._csv[key] = open(folder / f"{key[1]}-{key[2]}.csv", 'w', newline='')
+        df.to_csv(f, index=False, header=header)
+
+    def _write_xlsx(self, key, df: pd.DataFrame):
+        from openpyxl import Workbook
+
+        report, scope, section = key
+        book = self._books.get((report, scope))
+        if book is None:
+            book = self._books[(report, scope)] = Workbook(write_only=True)
+        state = self._sheets.get(key)
+        values = df.astype(object).where(df.notna(), None).itertuples(index=False, name=None)
+        for row in values:
+            if state is None or state[1] >= XLSX_MAX_ROWS:
+                count = 1 if state is None else state[2] + 1
+                sheet = book.create_sheet(section if count == 1 else f"{section} ({count})")
+                sheet.append(list(df.columns))
+                state = self._sheets[key] = [sheet, 0, count]
+            state[0].append(list(row))
+            state[1] += 1
+        if state is None:
+            # Keep empty sections visible with their header
+            sheet = book.create_sheet(section)
+            sheet.append(list(df.columns))
+            self._sheets[key] = [sheet, 0, 1]
+
+    def close(self):
+        for f in self._csv.values():
+            f.close()
+        for (report, scope), book in self._books.items():
+            book.save(self.out_dir / report_slug(report) / f"{scope}.xlsx")
+        self._csv.clear()
+        self._books.clear()
+
+
+def generate(data_dir: str = "data", out_dir: Optional[str] = None, fmt: str = 'csv',
+             reports: Optional[List[str]] = None, client_ids: Optional[List[str]] = None,
+             portfolio: bool = True, per_client: bool = True,
+             workers: Optional[int] = None, batch_size: int = 200,
+             shared_dir: Optional[str] = None) -> Path:
+    """Write the reports for the portfolio and every (or the given) client; return the output folder
+
+    Workers map the tables published to shared_dir, when present, instead
+    of each loading its own copy.
+    """
+    reports = reports or list(REPORT_BUILDERS)
+    out_dir = Path(out_dir or Path('reports') / datetime.now().strftime('%Y-%m'))
+    loader = DataLoader(data_dir=data_dir, shared_dir=shared_dir)
+    versions = {}
+    for name in ('clients', 'engagements', 'deliverables', 'summaries'):
+        version, df = loader.load_versioned(name)  # warms the shared Parquet cache
+        versions[name] = version
+        if name == 'clients' and client_ids is None:
+            client_ids = df['client_id'].astype(str).tolist()
+
+    batches = [None] if portfolio else []
+    if per_client:
+        batches += [client_ids[i:i + batch_size] for i in range(0, len(client_ids), batch_size)]
+
+    writer = ReportWriter(out_dir, fmt)
+    workers = workers or os.cpu_count() or 1
+    try:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(data_dir, versions, shared_dir)) as pool:
+            # At most two batches per worker in flight; results are written in order
+            pending = deque()
+            for batch in batches:
+                scope = 'portfolio' if batch is None else 'clients'
+                pending.append((scope, pool.submit(build_batch, reports, batch)))
+                if len(pending) >= workers * 2:
+                    _write_result(writer, *pending.popleft())
+            while pending:
+                _write_result(writer, *pending.popleft())
+    finally:
+        writer.close()
+    return out_dir
+
+
+def _write_result(writer: ReportWriter, scope: str, future):
+    for report, sections in future.result().items():
+        for section, df in sections.items():
+            writer.write(report, scope, section, df)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Write every dashboard report, portfolio-wide and per client")
+    parser.add_argument('--data-dir', default='data')
+    parser.add_argument('--out', help="output folder (default: reports/<YYYY-MM>)")
+    parser.add_argument('--format', choices=['csv', 'xlsx'], default='csv')
+    parser.add_argument('--report', action='append', choices=list(REPORT_BUILDERS),
+                        help="report to build (repeatable; default: all)")
+    parser.add_argument('--client', action='append', help="client_id to report on (repeatable; default: all)")
+    parser.add_argument('--no-portfolio', action='store_true', help="skip the portfolio-wide reports")
+    parser.add_argument('--no-clients', action='store_true', help="skip the per-client reports")
+    parser.add_argument('--workers', type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument('--batch-size', type=int, default=200, help="clients per worker task")
+    parser.add_argument('--shared-dir', default=None,
+                        help="shared table store to map tables from (default: <data-dir>/.shared)")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    out_dir = generate(args.data_dir, args.out, args.format, args.report, args.client,
+                       portfolio=not args.no_portfolio, per_client=not args.no_clients,
+                       workers=args.workers, batch_size=args.batch_size,
+                       shared_dir=args.shared_dir or os.path.join(args.data_dir, '.shared'))
+    print(f"Wrote reports to {out_dir} in {time.perf_counter() - start:.1f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,304 @@
+"""
+Embedded database backend for datasets larger than worker memory
+
+SQLStore copies the CSV tables into a local database file (DuckDB if it is
+installed, SQLite otherwise), chunk by chunk, with indexes on the join and
+filter columns. SQLAnalyzer answers the portfolio summary, client health,
+engagement performance and at-risk queries with SQL aggregations against
+that file, so only their (small) results are held in memory.
+"""
+
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+try:
+    import duckdb
+except ImportError:
+    duckdb = None
+
+from .analyzer import DataAnalyzer, TABLES, budget_utilization_ratio, memoized, score_client_health
+from .data_loader import TABLE_SCHEMAS, DataLoader
+
+SQL_TYPES = {'object': 'TEXT', 'category': 'TEXT', 'int64': 'BIGINT', 'float64': 'DOUBLE'}
+
+# Columns indexed in every table that has them
+INDEXED_COLUMNS = ('client_id', 'engagement_id', 'status', 'due_date')
+
+# SQLite keeps timestamps as ISO text, which sorts and compares chronologically
+SQLITE_TIMESTAMP = '%Y-%m-%d %H:%M:%S'
+
+PERFORMANCE_QUERY = """
+    SELECT e.*,
+           e.rowid AS row_order,
+           e.budget_allocated - e.budget_spent AS budget_remaining,
+           CAST(e.budget_spent AS DOUBLE) / NULLIF(e.budget_allocated, 0) * 100 AS budget_utilization_pct,
+           d.total_deliverables,
+           d.completed_deliverables,
+           COALESCE(d.avg_quality_score, 0) AS avg_quality_score,
+           COALESCE(CAST(d.completed_deliverables AS DOUBLE) / d.total_deliverables * 100, 0) AS deliverable_completion_pct
+    FROM engagements e
+    LEFT JOIN (
+        SELECT engagement_id,
+               COUNT(deliverable_id) AS total_deliverables,
+               SUM(CASE WHEN status = 'Completed' THEN 1 ELSE 0 END) AS completed_deliverables,
+               AVG(quality_score) AS avg_quality_score
+        FROM deliverables
+        GROUP BY engagement_id
+    ) d ON d.engagement_id = e.engagement_id
+"""
+
+# Rounded after the fetch: SQL ROUND takes halves away from zero, pandas to even
+PERFORMANCE_ROUNDED = ('budget_utilization_pct', 'avg_quality_score', 'deliverable_completion_pct')
+
+HEALTH_QUERY = """
+    SELECT c.client_id, c.client_name, c.status,
+           COALESCE(s.engagement_count, 0) AS engagement_count,
+           COALESCE(s.avg_progress, 0.0) AS avg_progress,
+           COALESCE(s.spent, 0) AS budget_spent,
+           COALESCE(s.allocated, 0) AS budget_allocated
+    FROM clients c
+    LEFT JOIN (
+        SELECT client_id,
+               COUNT(*) AS engagement_count,
+               AVG(CASE WHEN status = 'In Progress' THEN progress END) AS avg_progress,
+               SUM(budget_spent) AS spent,
+               SUM(budget_allocated) AS allocated
+        FROM engagements
+        GROUP BY client_id
+    ) s ON s.client_id = c.client_id
+    ORDER BY c.rowid
+"""
+
+SUMMARY_QUERY = """
+    SELECT (SELECT COUNT(*) FROM clients) AS total_clients,
+           (SELECT COUNT(*) FROM clients WHERE status = 'Active') AS active_clients,
+           (SELECT COALESCE(SUM(contract_value), 0) FROM clients) AS total_contract_value,
+           COUNT(*) AS total_engagements,
+           COALESCE(SUM(CASE WHEN status = 'In Progress' THEN 1 ELSE 0 END), 0) AS active_engagements,
+           COALESCE(SUM(CASE WHEN status = 'Completed' THEN 1 ELSE 0 END), 0) AS completed_engagements,
+           AVG(CASE WHEN status = 'In Progress' THEN progress END) AS average_progress
+    FROM engagements
+"""
+
+
+def table_dates(name: str) -> List[str]:
+    """Date columns of a table"""
+    schema = TABLE_SCHEMAS[name]
+    return schema['dates'] + schema['optional_dates']
+
+
+class SQLStore:
+    """Typed copies of the source tables in an embedded database file
+
+    Each table is rebuilt, inside one transaction, only when its CSV's
+    version token differs from the one recorded at the last sync.
+    """
+
+    def __init__(self, path, engine: Optional[str] = None):
+        self.path = Path(path)
+        if engine is None:
+            engine = 'duckdb' if duckdb is not None else 'sqlite'
+        if engine == 'duckdb' and duckdb is None:
+            raise ImportError("duckdb is not installed; use engine='sqlite'")
+        if engine not in ('duckdb', 'sqlite'):
+            raise ValueError(f"Unknown SQL engine: {engine}")
+        self.engine = engine
+        self._write_lock = threading.Lock()
+        self._duckdb = None
+
+    @contextmanager
+    def connect(self):
+        """Connection for one operation (each thread gets its own)"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if self.engine == 'duckdb':
+            if self._duckdb is None:
+                self._duckdb = duckdb.connect(str(self.path))
+            con = self._duckdb.cursor()
+        else:
+            con = sqlite3.connect(self.path, isolation_level=None, timeout=30)
+            con.execute('PRAGMA journal_mode=WAL')
+        try:
+            yield con
+        finally:
+            con.close()
+
+    def query(self, sql: str, params=(), table: Optional[str] = None) -> pd.DataFrame:
+        """Run a query and return its result as a frame
+
+        Result columns named after a column of table get that column's
+        schema type back (dates and categoricals do not survive the database).
+        """
+        with self.connect() as con:
+            if self.engine == 'duckdb':
+                df = con.execute(sql, list(params)).df()
+            else:
+                df = pd.read_sql_query(sql, con, params=params)
+        if table is not None:
+            schema = TABLE_SCHEMAS[table]
+            for col in df.columns:
+                if col in table_dates(table):
+                    df[col] = pd.to_datetime(df[col])
+                elif schema['dtypes'].get(col) in ('object', 'category'):
+                    df[col] = df[col].astype(schema['dtypes'][col])
+        return df
+
+    def versions(self) -> Dict[str, str]:
+        """Version token of each table at its last sync"""
+        with self.connect() as con:
+            con.execute("CREATE TABLE IF NOT EXISTS _versions (name TEXT PRIMARY KEY, version TEXT)")
+            return dict(con.execute("SELECT name, version FROM _versions").fetchall())
+
+    def sync(self, loader: DataLoader, names=TABLES) -> List[str]:
+        """Rebuild the tables whose source files changed; return their names"""
+        with self._write_lock:
+            stored = self.versions()
+            changed = []
+            for name in names:
+                version = loader.table_version(name)
+                if stored.get(name) != version:
+                    self._rebuild(name, loader, version)
+                    changed.append(name)
+            return changed
+
+    def _rebuild(self, name: str, loader: DataLoader, version: str):
+        schema = TABLE_SCHEMAS[name]
+        types = {col: SQL_TYPES[dtype] for col, dtype in schema['dtypes'].items()}
+        types.update({col: 'TIMESTAMP' for col in table_dates(name)})
+
+        with self.connect() as con:
+            con.execute("BEGIN")
+            try:
+                con.execute(f"DROP TABLE IF EXISTS {name}")
+                columns = None
+                for chunk in loader.iter_chunks(name):
+                    if columns is None:
+                        # Schema columns, in the order the CSV has them
+                        columns = [col for col in chunk.columns if col in types]
+                        con.execute(f"CREATE TABLE {name} ({', '.join(f'{col} {types[col]}' for col in columns)})")
+                    self._insert(con, name, chunk[columns])
+                if columns is None:
+                    raise ValueError(f"{schema['filename']} is empty")
+                for col in INDEXED_COLUMNS:
+                    if col in types:
+                        con.execute(f"CREATE INDEX idx_{name}_{col} ON {name} ({col})")
+                con.execute("DELETE FROM _versions WHERE name = ?", [name])
+                con.execute("INSERT INTO _versions VALUES (?, ?)", [name, version])
+                con.execute("COMMIT")
+            except BaseException:
+                con.execute("ROLLBACK")
+                raise
+
+    def _insert(self, con, name: str, chunk: pd.DataFrame):
+        if self.engine == 'duckdb':
+            con.register('_chunk', chunk)
+            con.execute(f"INSERT INTO {name} SELECT * FROM _chunk")
+            con.unregister('_chunk')
+            return
+
+        chunk = chunk.copy(deep=False)
+        for col in chunk.columns:
+            if pd.api.types.is_datetime64_any_dtype(chunk[col]):
+                chunk[col] = chunk[col].dt.strftime(SQLITE_TIMESTAMP)
+        values = chunk.astype(object).where(chunk.notna(), None)
+        placeholders = ', '.join('?' * len(chunk.columns))
+        con.executemany(f"INSERT INTO {name} VALUES ({placeholders})", values.itertuples(index=False, name=None))
+
+
+class SQLAnalyzer(DataAnalyzer):
+    """DataAnalyzer whose aggregate queries run inside a SQLStore
+
+    The portfolio summary, client health, engagement performance and
+    at-risk queries are answered by the database; everything else falls
+    back to the in-memory frames, fetched from table_source on first use.
+    Call sync() to bring the store up to date before a rerun.
+    """
+
+    def __init__(self, store: SQLStore, loader: DataLoader, **kwargs):
+        kwargs.setdefault('table_source', loader.load_versioned)
+        super().__init__(**kwargs)
+        self.store = store
+        self.loader = loader
+
+    def sync(self) -> List[str]:
+        """Update the store from changed CSVs and drop everything derived from them"""
+        changed = self.store.sync(self.loader)
+        versions = self.store.versions()
+        with self._lock:
+            for name in changed:
+                # Held frames are re-fetched from table_source on next use
+                self._tables.pop(name, None)
+            self.versions.update({name: versions[name] for name in TABLES if name in versions})
+            if changed:
+                self.invalidate(changed)
+        return changed
+
+    @memoized('clients', 'engagements')
+    def get_portfolio_summary(self) -> Dict:
+        """Get overall portfolio metrics"""
+        summary = self.store.query(SUMMARY_QUERY).iloc[0].to_dict()
+        average_progress = summary.pop('average_progress')
+        summary = {key: int(value) for key, value in summary.items()}
+        summary['average_progress'] = np.nan if average_progress is None else float(average_progress)
+        return summary
+
+    @memoized('clients', 'engagements')
+    def get_client_health(self) -> pd.DataFrame:
+        """Get health metrics for each client"""
+        health_data = self.store.query(HEALTH_QUERY, table='clients')
+        # Divided here so zero budgets score exactly as in DataAnalyzer
+        health_data['budget_utilization'] = budget_utilization_ratio(
+            health_data.pop('budget_spent'), health_data.pop('budget_allocated'))
+        return score_client_health(health_data, self.health_weights)
+
+    def get_engagement_performance(self, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """Get performance metrics for each engagement
+
+        Pass columns to fetch just those columns from the database.
+        """
+        return self._engagement_performance_columns(tuple(columns or ()))
+
+    @memoized('engagements', 'deliverables', maxsize=16)
+    def _engagement_performance_columns(self, columns) -> pd.DataFrame:
+        select = ', '.join(columns) if columns else '*'
+        perf_data = self.store.query(
+            f"SELECT {select}, row_order FROM ({PERFORMANCE_QUERY}) AS perf ORDER BY row_order",
+            table='engagements'
+        )
+        rounded = [column for column in PERFORMANCE_ROUNDED if column in perf_data.columns]
+        perf_data[rounded] = perf_data[rounded].round(1)
+        return perf_data.drop(columns='row_order')
+    
+    def get_at_risk_items(self, as_of=None) -> Dict[str, pd.DataFrame]:
+        """Identify at-risk engagements and deliverables
+
+        Deliverables count as overdue if still open and due before as_of
+        (default: now); the due_date index keeps this a range scan.
+        """
+        as_of = pd.Timestamp.now() if as_of is None else pd.Timestamp(as_of)
+        if self.store.engine == 'sqlite':
+            as_of = as_of.strftime(SQLITE_TIMESTAMP)
+        else:
+            as_of = as_of.to_pydatetime()
+        return {
+            'over_budget_engagements': self.store.query(
+                "SELECT engagement_id, engagement_name, budget_allocated, budget_spent "
+                "FROM engagements WHERE budget_spent > budget_allocated ORDER BY rowid",
+                table='engagements'
+            ),
+            'at_risk_deliverables': self.store.query(
+                "SELECT deliverable_id, deliverable_name, due_date, status FROM deliverables "
+                "WHERE due_date < ? AND status <> 'Completed' ORDER BY rowid",
+                params=(as_of,), table='deliverables'
+            ),
+            'paused_engagements': self.store.query(
+                "SELECT engagement_id, engagement_name, progress "
+                "FROM engagements WHERE status = 'On Hold' ORDER BY rowid",
+                table='engagements'
+            ),
+        }
@@ -0,0 +1,115 @@
+"""
+Startup timing for the dashboard
+
+Heavy optional modules (Plotly) are imported lazily through lazy_import();
+every import, lazy or explicit, is timed so the cost of a cold start can be
+reported. Run this module to measure each import in a fresh interpreter:
+
+    python -m src.startup [--fail-over MS]
+"""
+
+import argparse
+import importlib
+import subprocess
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, List
+
+PROCESS_START = time.perf_counter()
+
+# Module name -> seconds spent importing it in this process
+import_times: Dict[str, float] = {}
+# Milestone label -> seconds since this module was first imported
+marks: Dict[str, float] = {}
+
+_lock = threading.Lock()
+
+# Modules measured by the command line report, heaviest dependencies first
+REPORT_MODULES = [
+    'numpy', 'pandas', 'pyarrow', 'plotly.express', 'streamlit',
+    'src.data_loader', 'src.analyzer', 'src.charts',
+]
+
+
+@contextmanager
+def timed_import(name: str):
+    """Record how long the imports inside the block take under name"""
+    start = time.perf_counter()
+    yield
+    with _lock:
+        import_times.setdefault(name, time.perf_counter() - start)
+
+
+class LazyModule:
+    """Module stand-in that performs (and times) the import on first attribute access"""
+
+    def __init__(self, name: str):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attr):
+        if self._module is None:
+            with timed_import(self._name):
+                self._module = importlib.import_module(self._name)
+        return getattr(self._module, attr)
+
+
+def lazy_import(name: str) -> LazyModule:
+    """Defer importing a module until it is first used"""
+    return LazyModule(name)
+
+
+def mark(label: str):
+    """Record the first time a milestone (e.g. 'first_render') is reached"""
+    with _lock:
+        marks.setdefault(label, time.perf_counter() - PROCESS_START)
+
+
+def startup_report() -> List[Dict]:
+    """Import times and milestones recorded in this process, in milliseconds"""
+    rows = [{'kind': 'import', 'name': name, 'ms': round(seconds * 1000, 1)}
+            for name, seconds in import_times.items()]
+    rows += [{'kind': 'milestone', 'name': label, 'ms': round(seconds * 1000, 1)}
+             for label, seconds in marks.items()]
+    return rows
+
+
+def measure_cold_import(module: str) -> float:
+    """Seconds a fresh interpreter takes to import a module"""
+    code = (
+        "import time; start = time.perf_counter(); "
+        f"import {module}; print(time.perf_counter() - start)"
+    )
+    output = subprocess.check_output([sys.executable, '-c', code], text=True)
+    return float(output.strip().splitlines()[-1])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure cold import time of dashboard modules")
+    parser.add_argument('modules', nargs='*', default=REPORT_MODULES)
+    parser.add_argument('--fail-over', type=float, metavar='MS',
+                        help="exit with status 1 if any module takes longer than MS")
+    args = parser.parse_args(argv)
+
+    slow = []
+    print(f"{'module':<20} {'cold import (ms)':>17}")
+    for module in args.modules:
+        try:
+            ms = measure_cold_import(module) * 1000
+        except subprocess.CalledProcessError:
+            print(f"{module:<20} {'failed':>17}")
+            continue
+        print(f"{module:<20} {ms:>17.1f}")
+        if args.fail_over is not None and ms > args.fail_over:
+            slow.append(module)
+
+    if slow:
+        print(f"\nOver {args.fail_over:.0f} ms: {', '.join(slow)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
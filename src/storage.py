@@ -0,0 +1,230 @@
+import json
+import os
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, Optional
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - pyarrow ships with streamlit
+    pa = None
+    pq = None
+
+try:
+    import fcntl
+except ImportError:  # Windows: run a single publisher
+    fcntl = None
+
+SIGNATURE_KEY = b'source_signature'
+
+
+def source_signature(filepath: Path) -> Dict:
+    """Return the mtime/size signature used to detect stale cache entries"""
+    stat = Path(filepath).stat()
+    return {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size}
+
+
+def signature_version(signature: Dict) -> str:
+    """Version token of a source signature, as handed out with loaded tables"""
+    return f"{signature['mtime_ns']}-{signature['size']}"
+
+
+def write_arrow(df: pd.DataFrame, path: Path):
+    """Write a frame as an uncompressed Arrow IPC file, which can be memory-mapped"""
+    table = pa.Table.from_pandas(df)
+    with pa.OSFile(str(path), 'wb') as sink, pa.ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table)
+
+
+def read_arrow(path: Path) -> pd.DataFrame:
+    """Memory-map an Arrow IPC file; fixed-width columns are not copied"""
+    # The mapping stays open for as long as the frame's buffers reference it
+    table = pa.ipc.open_file(pa.memory_map(str(path))).read_all()
+    return table.to_pandas(split_blocks=True)
+
+
+class ColumnarStore:
+    """Parquet cache of typed tables, keyed by the signature of their source file"""
+
+    def __init__(self, cache_dir):
+        self.cache_dir = Path(cache_dir)
+
+    @staticmethod
+    def available() -> bool:
+        """Whether pyarrow is installed and the store can be used"""
+        return pq is not None
+
+    def path_for(self, name: str) -> Path:
+        """Parquet file backing a table"""
+        return self.cache_dir / f"{name}.parquet"
+
+    def read(self, name: str, signature: Dict) -> Optional[pd.DataFrame]:
+        """Load a cached table, or None if it is missing or stale"""
+        path = self.path_for(name)
+        if not path.exists():
+            return None
+
+        try:
+            metadata = pq.read_schema(path).metadata or {}
+            if json.loads(metadata.get(SIGNATURE_KEY, b'null')) != signature:
+                return None
+            return pq.read_table(path).to_pandas()
+        except (OSError, ValueError, pa.ArrowException):
+            # A truncated or foreign file is treated as a cache miss
+            return None
+
+    def read_batches(self, name: str, signature: Dict, rows: int) -> Optional[Iterator[pd.DataFrame]]:
+        """Iterate over a cached table in frames of at most rows rows, or None if it is missing or stale"""
+        path = self.path_for(name)
+        if not path.exists():
+            return None
+
+        try:
+            parquet = pq.ParquetFile(path)
+            metadata = parquet.schema_arrow.metadata or {}
+            if json.loads(metadata.get(SIGNATURE_KEY, b'null')) != signature:
+                return None
+        except (OSError, ValueError, pa.ArrowException):
+            return None
+        return (pa.Table.from_batches([batch]).to_pandas() for batch in parquet.iter_batches(batch_size=rows))
+
+    def write(self, name: str, df: pd.DataFrame, signature: Dict):
+        """Write a typed table to the cache, tagged with its source signature"""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        metadata = dict(table.schema.metadata or {})
+        metadata[SIGNATURE_KEY] = json.dumps(signature).encode()
+        table = table.replace_schema_metadata(metadata)
+
+        path = self.path_for(name)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        pq.write_table(table, tmp_path)
+        os.replace(tmp_path, path)
+
+    def write_chunks(self, name: str, chunks: Iterable[pd.DataFrame], signature: Dict) -> int:
+        """Stream typed chunks into a table's Parquet file, one row group each
+
+        Only one chunk is held in memory at a time. The Arrow schema is fixed
+        by the first chunk, with categoricals widened to int32 dictionaries
+        (each chunk has its own categories) and all-null columns typed as
+        strings. Returns the number of rows written.
+        """
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self.path_for(name)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        writer = None
+        rows = 0
+
+        try:
+            for chunk in chunks:
+                if writer is None:
+                    schema = self._stream_schema(pa.Schema.from_pandas(chunk, preserve_index=False), signature)
+                    writer = pq.ParquetWriter(tmp_path, schema)
+                writer.write_table(pa.Table.from_pandas(chunk, schema=writer.schema, preserve_index=False))
+                rows += len(chunk)
+        except BaseException:
+            if writer is not None:
+                writer.close()
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+        if writer is None:
+            return 0
+        writer.close()
+        os.replace(tmp_path, path)
+        return rows
+
+    @staticmethod
+    def _stream_schema(schema, signature: Dict):
+        fields = []
+        for field in schema:
+            if pa.types.is_dictionary(field.type):
+                field = field.with_type(pa.dictionary(pa.int32(), field.type.value_type))
+            elif pa.types.is_null(field.type):
+                field = field.with_type(pa.string())
+            fields.append(field)
+        metadata = dict(schema.metadata or {})
+        metadata[SIGNATURE_KEY] = json.dumps(signature).encode()
+        return pa.schema(fields, metadata=metadata)
+
+    def clear(self):
+        """Remove every cached table"""
+        if self.cache_dir.exists():
+            for path in self.cache_dir.glob("*.parquet"):
+                path.unlink()
+
+
+class SharedTableStore:
+    """Typed tables published as Arrow files that every process memory-maps
+
+    One file is kept per table version, named after the signature of its
+    source CSV, so a reader that finds the file for the current signature
+    needs no other check. Files are written to a temporary name and renamed
+    into place, and publishers serialize on a lock file, so readers never
+    see a partial table. Mapped pages are shared through the OS page cache
+    by all sessions and worker processes on the machine.
+    """
+
+    def __init__(self, root, keep: int = 2):
+        self.root = Path(root)
+        self.keep = keep
+
+    def path_for(self, name: str, signature: Dict) -> Path:
+        return self.root / f"{name}-{signature_version(signature)}.arrow"
+
+    def read(self, name: str, signature: Dict) -> Optional[pd.DataFrame]:
+        """Map the published table for this source signature, or None if there is none"""
+        path = self.path_for(name, signature)
+        if pa is None or not path.exists():
+            return None
+        try:
+            return read_arrow(path)
+        except (OSError, pa.ArrowException):
+            # Pruned between the check and the read
+            return None
+
+    @contextmanager
+    def _writer_lock(self):
+        self.root.mkdir(parents=True, exist_ok=True)
+        with open(self.root / '.lock', 'w') as f:
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_EX)
+            yield
+
+    def publish(self, name: str, df: pd.DataFrame, signature: Dict) -> bool:
+        """Publish a table version unless it already is; returns whether it was written"""
+        with self._writer_lock():
+            path = self.path_for(name, signature)
+            if path.exists():
+                return False
+            tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+            try:
+                write_arrow(df, tmp_path)
+            except BaseException:
+                tmp_path.unlink(missing_ok=True)
+                raise
+            os.replace(tmp_path, path)
+            self.prune(name)
+            return True
+
+    def prune(self, name: str):
+        """Delete all but the newest keep versions of a table
+
+        Processes that still map a deleted file keep reading it; they pick
+        up the new version on their next load.
+        """
+        versions = sorted(self.root.glob(f"{name}-*.arrow"), key=lambda path: path.stat().st_mtime_ns, reverse=True)
+        for path in versions[self.keep:]:
+            try:
+                path.unlink()
+            except OSError:
+                pass  # still mapped on Windows; removed by a later publish
+
+    def clear(self):
+        """Remove every published table"""
+        if self.root.exists():
+            for path in self.root.glob("*.arrow"):
+                path.unlink(missing_ok=True)
@@ -0,0 +1,207 @@
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+NO_ROWS = np.array([], dtype=np.intp)
+
+# Columns with at most this many distinct values get one bitmap per value;
+# others are filtered by comparing their factorized codes
+BITMAP_MAX_VALUES = 64
+
+
+class TableIndex:
+    """Bitmap and sort-order indexes over one frame, for server-side table views
+
+    Low-cardinality columns get per-value bitmaps (one boolean array per
+    distinct value), so equality filters are an OR/AND of precomputed
+    arrays. Other columns keep their factorized codes, one integer per row,
+    and are filtered with np.isin on the wanted codes. Range filters are a binary search over the column's pre-sorted
+    values. Sort orders are computed once per column and direction; a
+    filtered, sorted result is the sort order masked by the filter bitmap,
+    so neither filtering nor sorting re-sorts the frame. Indexes are built lazily, the
+    first time a column is filtered or sorted on.
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        self.df = df
+        self.size = len(df)
+        self._codes = {}
+        self._bitmaps = {}
+        self._orders = {}
+        self._sorted_values = {}
+        self._lock = threading.Lock()
+
+    def values(self, column: str) -> List:
+        """Distinct non-null values of a column, for filter widgets"""
+        return list(self._value_codes(column)[1])
+
+    def _value_codes(self, column: str) -> Tuple[np.ndarray, Dict]:
+        """Factorized codes of a column and the code of each distinct value"""
+        entry = self._codes.get(column)
+        if entry is None:
+            codes, uniques = pd.factorize(self.df[column], sort=True)
+            entry = (codes, {value: i for i, value in enumerate(uniques)})
+            with self._lock:
+                self._codes[column] = entry
+        return entry
+
+    def bitmap(self, column: str, values: Iterable) -> np.ndarray:
+        """Rows whose column equals any of the given values"""
+        codes, code_of = self._value_codes(column)
+        wanted = [code_of[value] for value in values if value in code_of]
+        if len(code_of) > BITMAP_MAX_VALUES:
+            return np.isin(codes, wanted)
+
+        bitmaps = self._bitmaps.get(column)
+        if bitmaps is None:
+            bitmaps = [codes == i for i in range(len(code_of))]
+            with self._lock:
+                self._bitmaps[column] = bitmaps
+        mask = np.zeros(self.size, dtype=bool)
+        for code in wanted:
+            mask |= bitmaps[code]
+        return mask
+
+    def order(self, column: str, ascending: bool = True) -> np.ndarray:
+        """Row positions sorted by a column (stable, nulls last)"""
+        key = (column, ascending)
+        order = self._orders.get(key)
+        if order is None:
+            values = pd.Series(self.df[column].to_numpy(), index=np.arange(self.size))
+            order = values.sort_values(ascending=ascending, kind='stable', na_position='last').index.to_numpy()
+            with self._lock:
+                self._orders[key] = order
+        return order
+
+    def between(self, column: str, low=None, high=None) -> np.ndarray:
+        """Positions of the rows with low <= column <= high, in ascending column order
+
+        Either bound may be None for an open range. Nulls never match.
+        """
+        order = self.order(column)
+        values = self._sorted_values.get(column)
+        if values is None:
+            # Nulls sort last, so the non-null values are a sorted prefix
+            values = self.df[column].to_numpy()[order]
+            values = values[:len(values) - int(pd.isna(values).sum())]
+            with self._lock:
+                self._sorted_values[column] = values
+        start = 0 if low is None else np.searchsorted(values, low, side='left')
+        stop = len(values) if high is None else np.searchsorted(values, high, side='right')
+        return order[start:max(start, stop)]
+
+    def range_mask(self, column: str, low=None, high=None) -> np.ndarray:
+        """Rows with low <= column <= high, as a bitmap"""
+        mask = np.zeros(self.size, dtype=bool)
+        mask[self.between(column, low, high)] = True
+        return mask
+
+    def query(self, filters: Optional[Dict[str, Iterable]] = None,
+              ranges: Optional[Dict[str, Tuple]] = None,
+              mask: Optional[np.ndarray] = None,
+              sort_by: Optional[str] = None, ascending: bool = True) -> np.ndarray:
+        """Positions of the rows matching every filter, in sort order
+
+        filters maps a column to the values it may take, ranges maps a column
+        to inclusive (low, high) bounds, and mask is an optional extra boolean
+        row filter.
+        """
+        masks = [self.bitmap(column, values) for column, values in (filters or {}).items()]
+        masks += [self.range_mask(column, *bounds) for column, bounds in (ranges or {}).items()]
+        for column_mask in masks:
+            mask = column_mask if mask is None else mask & column_mask
+
+        if sort_by is None:
+            return np.arange(self.size) if mask is None else np.flatnonzero(mask)
+        order = self.order(sort_by, ascending)
+        return order if mask is None else order[mask[order]]
+
+    def page(self, positions: np.ndarray, page: int, page_size: int,
+             columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """Rows of one page (1-based) of a query result"""
+        start = (page - 1) * page_size
+        rows = self.df.iloc[positions[start:start + page_size]]
+        return rows[columns] if columns else rows
+
+
+class AtRiskIndex:
+    """Row positions of at-risk engagements and deliverables
+
+    Over-budget and on-hold engagements are kept as position arrays, and
+    open (not completed) deliverables are kept sorted by due date, so the
+    deliverables overdue as of any moment are a prefix found by binary
+    search. Appended rows are folded in with extend_engagements() and
+    extend_deliverables() instead of rescanning the tables.
+    """
+
+    # The only columns the index reads from each table
+    COLUMNS = {
+        'engagements': ['status', 'budget_allocated', 'budget_spent'],
+        'deliverables': ['status', 'due_date'],
+    }
+
+    def __init__(self, engagements: pd.DataFrame, deliverables: pd.DataFrame):
+        self.over_budget = NO_ROWS
+        self.on_hold = NO_ROWS
+        self.open_deliverables = NO_ROWS
+        self.open_due_dates = np.array([], dtype='datetime64[ns]')
+        self.engagement_count = 0
+        self.deliverable_count = 0
+        self.extend_engagements(engagements)
+        self.extend_deliverables(deliverables)
+
+    def extend_engagements(self, rows: pd.DataFrame):
+        """Index engagement rows appended after the ones already indexed"""
+        offset = self.engagement_count
+        over_budget = (rows['budget_spent'] > rows['budget_allocated']).to_numpy()
+        on_hold = (rows['status'] == 'On Hold').to_numpy()
+        self.over_budget = np.concatenate([self.over_budget, np.flatnonzero(over_budget) + offset])
+        self.on_hold = np.concatenate([self.on_hold, np.flatnonzero(on_hold) + offset])
+        self.engagement_count += len(rows)
+
+    def extend_deliverables(self, rows: pd.DataFrame):
+        """Index deliverable rows appended after the ones already indexed"""
+        is_open = (rows['status'] != 'Completed').to_numpy()
+        positions = np.flatnonzero(is_open)
+        due_dates = rows['due_date'].to_numpy('datetime64[ns]')[positions]
+        order = np.argsort(due_dates, kind='stable')
+        positions, due_dates = positions[order] + self.deliverable_count, due_dates[order]
+
+        # Merge the new, sorted entries into the sorted ones already held
+        at = np.searchsorted(self.open_due_dates, due_dates, side='right')
+        self.open_deliverables = np.insert(self.open_deliverables, at, positions)
+        self.open_due_dates = np.insert(self.open_due_dates, at, due_dates)
+        self.deliverable_count += len(rows)
+
+    def overdue(self, as_of) -> np.ndarray:
+        """Positions of open deliverables due before as_of, earliest first"""
+        stop = np.searchsorted(self.open_due_dates, np.datetime64(pd.Timestamp(as_of), 'ns'), side='left')
+        return self.open_deliverables[:stop]
+
+    def to_frame(self) -> pd.DataFrame:
+        """The index as one frame of (set, position, due_date) rows, for snapshots"""
+        sets = {'over_budget': self.over_budget, 'on_hold': self.on_hold, 'open': self.open_deliverables}
+        return pd.DataFrame({
+            'set': np.repeat(list(sets), [len(positions) for positions in sets.values()]),
+            'position': np.concatenate(list(sets.values())).astype(np.int64),
+            'due_date': np.concatenate([
+                np.full(len(self.over_budget) + len(self.on_hold), np.datetime64('NaT'), dtype='datetime64[ns]'),
+                self.open_due_dates
+            ]),
+        })
+
+    @classmethod
+    def from_frame(cls, frame: pd.DataFrame, engagement_count: int, deliverable_count: int) -> 'AtRiskIndex':
+        """Rebuild an index saved with to_frame() for tables of the given lengths"""
+        index = cls.__new__(cls)
+        sets = frame['set'].to_numpy()
+        positions = frame['position'].to_numpy(np.intp)
+        index.over_budget = positions[sets == 'over_budget']
+        index.on_hold = positions[sets == 'on_hold']
+        index.open_deliverables = positions[sets == 'open']
+        index.open_due_dates = frame['due_date'].to_numpy('datetime64[ns]')[sets == 'open']
+        index.engagement_count = engagement_count
+        index.deliverable_count = deliverable_count
+        return index